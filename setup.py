@@ -22,10 +22,14 @@ setup(
         "pyyaml>=6.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8",
+        ],
         "dev": [
             "pytest>=7.0",
             "pytest-cov>=4.0",
             "pytest-mock>=3.10",
+            "pytest-xdist>=3.0",
             "mypy>=1.0",
             "black>=23.0",
             "isort>=5.12",
@@ -4,13 +4,23 @@ Base Agent Interface and Data Classes
 Defines the contract for all AI agents (Claude, Codex) and common data structures.
 """
 
+import asyncio
+import shutil
+import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Callable, Optional, List, Iterator
 from datetime import datetime
 
 
+@lru_cache(maxsize=None)
+def _which(command: str) -> Optional[str]:
+    """Resolve a CLI command on PATH, once per process."""
+    return shutil.which(command)
+
+
 class AgentType(Enum):
     """Available AI agent types"""
     CLAUDE = "claude"
@@ -30,7 +40,7 @@ class AgentCapability(Enum):
     VERIFICATION = "verification"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentResponse:
     """Response from an agent execution"""
     success: bool
@@ -88,6 +98,7 @@ class AgentConfig:
     json_output: bool = True
     work_dir: Optional[str] = None
     env_vars: Dict[str, str] = field(default_factory=dict)
+    max_output_chars: Optional[int] = None  # Truncate output beyond this, None keeps all
 
 
 class IAgent(ABC):
@@ -98,10 +109,42 @@ class IAgent(ABC):
     to be usable in the orchestration system.
     """
 
-    def __init__(self, config: AgentConfig):
+    def __init__(
+        self,
+        config: AgentConfig,
+        runner: Optional[Callable[..., Any]] = None,
+        popen: Optional[Callable[..., Any]] = None,
+    ):
+        """
+        Initialize agent.
+
+        Args:
+            config: Agent configuration
+            runner: Optional stand-in for subprocess.run, e.g. in tests
+            popen: Optional stand-in for subprocess.Popen, used when streaming
+        """
         self.config = config
+        self._runner = runner
+        self._popen_factory = popen
         self._capabilities: List[AgentCapability] = []
 
+    def _run(self, *args, **kwargs) -> Any:
+        """Run a CLI command through the injected runner or subprocess.run."""
+        runner = self._runner or subprocess.run
+        return runner(*args, **kwargs)
+
+    def _popen(self, *args, **kwargs) -> Any:
+        """Start a CLI process through the injected popen or subprocess.Popen."""
+        popen = self._popen_factory or subprocess.Popen
+        return popen(*args, **kwargs)
+
+    def _cap_output(self, output: str) -> str:
+        """Truncate output to config.max_output_chars, if set."""
+        cap = self.config.max_output_chars
+        if cap is not None and len(output) > cap:
+            return output[:cap]
+        return output
+
     @property
     def agent_type(self) -> AgentType:
         """Return the type of this agent"""
@@ -126,6 +169,44 @@ class IAgent(ABC):
         """
         pass
 
+    def execute_stream(self, prompt: str, work_dir: Optional[str] = None) -> Iterator[str]:
+        """
+        Execute a prompt and yield output chunks as they become available.
+
+        Closing the iterator early stops the execution. The default
+        implementation runs execute() and yields the output as one chunk.
+
+        Args:
+            prompt: The instruction or prompt to execute
+            work_dir: Optional working directory override
+
+        Yields:
+            Output chunks
+
+        Raises:
+            RuntimeError: If execution fails
+        """
+        response = self.execute(prompt, work_dir)
+        if not response.success:
+            raise RuntimeError(response.error or "Execution failed")
+        yield response.output
+
+    async def a_execute(self, prompt: str, work_dir: Optional[str] = None) -> AgentResponse:
+        """
+        Execute a prompt without blocking the event loop.
+
+        Agents shell out to their CLI, so execute() runs in a worker
+        thread and several calls can be awaited concurrently.
+
+        Args:
+            prompt: The instruction or prompt to execute
+            work_dir: Optional working directory override
+
+        Returns:
+            AgentResponse with execution results
+        """
+        return await asyncio.to_thread(self.execute, prompt, work_dir)
+
     @abstractmethod
     def analyze(self, context: str, question: str) -> str:
         """
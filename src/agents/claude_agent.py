@@ -7,8 +7,8 @@ Adapter for using Claude Code CLI as an AI agent in the orchestration system.
 import subprocess
 import json
 import os
-import shutil
-from typing import Optional, List
+import threading
+from typing import Any, Callable, Optional, List, Iterator
 from pathlib import Path
 
 from .base import (
@@ -17,6 +17,7 @@ from .base import (
     AgentCapability,
     AgentResponse,
     AgentConfig,
+    _which,
 )
 
 
@@ -28,7 +29,12 @@ class ClaudeAgent(IAgent):
     Claude excels at analysis, planning, and strategic decisions.
     """
 
-    def __init__(self, config: Optional[AgentConfig] = None):
+    def __init__(
+        self,
+        config: Optional[AgentConfig] = None,
+        runner: Optional[Callable[..., Any]] = None,
+        popen: Optional[Callable[..., Any]] = None,
+    ):
         if config is None:
             config = AgentConfig(
                 command="claude",
@@ -36,7 +42,7 @@ class ClaudeAgent(IAgent):
                 sandbox=True,
                 json_output=True,
             )
-        super().__init__(config)
+        super().__init__(config, runner, popen)
 
         self._capabilities = [
             AgentCapability.CODE_ANALYSIS,
@@ -78,7 +84,7 @@ class ClaudeAgent(IAgent):
             import time
             start_time = time.time()
 
-            result = subprocess.run(
+            result = self._run(
                 cmd,
                 cwd=work_dir,
                 capture_output=True,
@@ -109,7 +115,7 @@ class ClaudeAgent(IAgent):
 
             return AgentResponse(
                 success=result.returncode == 0,
-                output=output,
+                output=self._cap_output(output),
                 files_modified=files_modified,
                 files_created=files_created,
                 error=result.stderr if result.returncode != 0 else None,
@@ -131,6 +137,66 @@ class ClaudeAgent(IAgent):
         except Exception as e:
             return AgentResponse.error_response(str(e), exit_code=-3)
 
+    def execute_stream(self, prompt: str, work_dir: Optional[str] = None) -> Iterator[str]:
+        """
+        Execute a prompt and yield output lines as Claude produces them.
+
+        Uses plain text output so lines can be consumed incrementally.
+        Closing the iterator early terminates the CLI process.
+
+        Args:
+            prompt: The instruction to execute
+            work_dir: Working directory for execution
+
+        Yields:
+            Output lines
+
+        Raises:
+            RuntimeError: If the CLI is missing, times out or exits with an error
+        """
+        work_dir = work_dir or self.config.work_dir or os.getcwd()
+
+        try:
+            process = self._popen(
+                [self.config.command, "--print", prompt],
+                cwd=work_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                env={**os.environ, **self.config.env_vars},
+            )
+        except FileNotFoundError:
+            raise RuntimeError(f"Claude CLI not found: {self.config.command}")
+
+        # Kill the CLI once the budget is spent, reading stops at EOF
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(self.config.timeout, kill)
+        timer.start()
+
+        try:
+            for line in process.stdout:
+                yield line
+
+            try:
+                returncode = process.wait(timeout=self.config.timeout)
+            except subprocess.TimeoutExpired:
+                timed_out.set()
+            if timed_out.is_set():
+                raise RuntimeError(f"Claude timed out after {self.config.timeout}s")
+            if returncode != 0:
+                raise RuntimeError(f"Claude exited with code {returncode}")
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
     def analyze(self, context: str, question: str) -> str:
         """
         Analyze context and answer a question.
@@ -183,7 +249,7 @@ Answer with only "PASS" if it matches or "FAIL" if it doesn't match."""
 
     def is_available(self) -> bool:
         """Check if Claude CLI is available."""
-        return shutil.which(self.config.command) is not None
+        return _which(self.config.command) is not None
 
     def plan_implementation(
         self,
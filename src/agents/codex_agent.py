@@ -7,8 +7,7 @@ Adapter for using Codex CLI as an AI agent in the orchestration system.
 import subprocess
 import json
 import os
-import shutil
-from typing import Optional, List
+from typing import Any, Callable, Optional, List
 from pathlib import Path
 
 from .base import (
@@ -17,6 +16,7 @@ from .base import (
     AgentCapability,
     AgentResponse,
     AgentConfig,
+    _which,
 )
 
 
@@ -28,7 +28,12 @@ class CodexAgent(IAgent):
     Codex excels at code generation, implementation, and execution.
     """
 
-    def __init__(self, config: Optional[AgentConfig] = None):
+    def __init__(
+        self,
+        config: Optional[AgentConfig] = None,
+        runner: Optional[Callable[..., Any]] = None,
+        popen: Optional[Callable[..., Any]] = None,
+    ):
         if config is None:
             config = AgentConfig(
                 command="codex",
@@ -37,7 +42,7 @@ class CodexAgent(IAgent):
                 full_auto=True,
                 json_output=True,
             )
-        super().__init__(config)
+        super().__init__(config, runner, popen)
 
         self._capabilities = [
             AgentCapability.CODE_GENERATION,
@@ -86,7 +91,7 @@ class CodexAgent(IAgent):
             import time
             start_time = time.time()
 
-            result = subprocess.run(
+            result = self._run(
                 cmd,
                 cwd=work_dir,
                 capture_output=True,
@@ -123,7 +128,7 @@ class CodexAgent(IAgent):
 
             return AgentResponse(
                 success=result.returncode == 0,
-                output=output,
+                output=self._cap_output(output),
                 files_modified=files_modified,
                 files_created=files_created,
                 files_deleted=files_deleted,
@@ -181,7 +186,7 @@ class CodexAgent(IAgent):
             import time
             start_time = time.time()
 
-            result = subprocess.run(
+            result = self._run(
                 cmd,
                 cwd=work_dir,
                 input=prompt,
@@ -195,7 +200,7 @@ class CodexAgent(IAgent):
 
             return AgentResponse(
                 success=result.returncode == 0,
-                output=result.stdout,
+                output=self._cap_output(result.stdout),
                 error=result.stderr if result.returncode != 0 else None,
                 exit_code=result.returncode,
                 execution_time=execution_time,
@@ -242,7 +247,7 @@ Output only: MATCH or MISMATCH"""
 
     def is_available(self) -> bool:
         """Check if Codex CLI is available."""
-        return shutil.which(self.config.command) is not None
+        return _which(self.config.command) is not None
 
     def generate_code(
         self,
@@ -6,7 +6,7 @@ Parses GOAL.txt files to extract structured goal information.
 
 import re
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from enum import Enum
 
@@ -65,11 +65,17 @@ class Goal:
     def completed_criteria(self) -> int:
         return sum(1 for c in self.acceptance_criteria if c.completed)
 
+    @property
+    def progress_ratio(self) -> Tuple[int, int]:
+        """(completed, total) criteria counts"""
+        return self.completed_criteria, self.total_criteria
+
     @property
     def progress_percentage(self) -> float:
-        if self.total_criteria == 0:
+        completed, total = self.progress_ratio
+        if total == 0:
             return 0.0
-        return (self.completed_criteria / self.total_criteria) * 100
+        return (completed / total) * 100
 
     @property
     def is_achieved(self) -> bool:
@@ -78,6 +84,7 @@ class Goal:
         return all(c.completed for c in self.acceptance_criteria)
 
     def to_dict(self) -> Dict[str, Any]:
+        completed, total = self.progress_ratio
         return {
             "title": self.title,
             "description": self.description,
@@ -86,9 +93,9 @@ class Goal:
             "constraints": self.constraints,
             "metadata": self.metadata,
             "progress": {
-                "total": self.total_criteria,
-                "completed": self.completed_criteria,
-                "percentage": self.progress_percentage,
+                "total": total,
+                "completed": completed,
+                "percentage": (completed / total) * 100 if total else 0.0,
             },
         }
 
@@ -98,11 +105,12 @@ class Goal:
 
     def get_next_criterion(self) -> Optional[AcceptanceCriterion]:
         """Get the next criterion to work on."""
-        pending = self.get_pending_criteria()
-        if pending:
-            # Return highest priority pending criterion
-            return min(pending, key=lambda c: c.priority)
-        return None
+        # Highest priority pending criterion, found without building the pending list
+        return min(
+            (c for c in self.acceptance_criteria if not c.completed),
+            key=lambda c: c.priority,
+            default=None,
+        )
 
 
 class GoalParser:
@@ -131,11 +139,11 @@ class GoalParser:
     # List item pattern: - item
     LIST_PATTERN = re.compile(r"^-\s+(.+)$")
 
-    def __init__(self):
-        self._compiled_patterns = {
-            name: re.compile(pattern, re.IGNORECASE)
-            for name, pattern in self.SECTION_PATTERNS.items()
-        }
+    # Section patterns compiled once for all parsers
+    _SECTION_RES = {
+        name: re.compile(pattern, re.IGNORECASE)
+        for name, pattern in SECTION_PATTERNS.items()
+    }
 
     def parse_file(self, file_path: str) -> Goal:
         """
@@ -171,13 +179,10 @@ class GoalParser:
         if not content.strip():
             raise ValueError("Goal content is empty")
 
-        lines = content.split("\n")
         goal = Goal(title="", raw_content=content)
+        title: Optional[str] = None
 
-        # Parse title (first # heading)
-        goal.title = self._extract_title(lines)
-
-        # Parse sections
+        # Parse sections in one pass, dispatching on each line's first two characters
         current_section = "description"
         section_content: Dict[str, List[str]] = {
             "description": [],
@@ -186,22 +191,29 @@ class GoalParser:
             "constraints": [],
         }
 
-        for line in lines:
-            # Check for section header
-            new_section = self._identify_section(line)
-            if new_section:
-                current_section = new_section
+        for line in content.split("\n"):
+            stripped = line.strip()
+            if not stripped:
                 continue
 
-            # Skip title line
-            if line.strip().startswith("# ") and not line.strip().startswith("## "):
+            head = stripped[:2]
+            if head == "##":
+                # Check for section header
+                new_section = self._identify_section(stripped)
+                if new_section:
+                    current_section = new_section
+                    continue
+            elif head == "# ":
+                # Title is the first # heading, later ones are skipped too
+                if title is None:
+                    title = stripped[2:].strip()
                 continue
 
             # Add line to current section
-            if line.strip():
-                section_content[current_section].append(line)
+            section_content[current_section].append(line)
 
         # Process sections
+        goal.title = title if title is not None else "Untitled Goal"
         goal.description = "\n".join(section_content["description"]).strip()
         goal.acceptance_criteria = self._parse_criteria(section_content["criteria"])
         goal.quality_requirements = self._parse_list(section_content["quality"])
@@ -209,36 +221,34 @@ class GoalParser:
 
         return goal
 
-    def _extract_title(self, lines: List[str]) -> str:
-        """Extract title from first # heading."""
-        for line in lines:
-            if line.strip().startswith("# ") and not line.strip().startswith("## "):
-                return line.strip()[2:].strip()
-        return "Untitled Goal"
-
     def _identify_section(self, line: str) -> Optional[str]:
         """Identify if line is a section header."""
-        for name, pattern in self._compiled_patterns.items():
-            if pattern.match(line.strip()):
+        stripped = line.strip()
+        for name, pattern in self._SECTION_RES.items():
+            if pattern.match(stripped):
                 return name
         return None
 
     def _parse_criteria(self, lines: List[str]) -> List[AcceptanceCriterion]:
-        """Parse acceptance criteria from lines."""
+        """Parse acceptance criteria from "- [ ] text" / "- [x] text" lines."""
         criteria = []
 
         for line in lines:
-            match = self.CHECKBOX_PATTERN.match(line.strip())
-            if match:
-                completed = match.group(1).lower() == "x"
-                description = match.group(2).strip()
-
-                criterion = AcceptanceCriterion(
-                    description=description,
-                    completed=completed,
-                    status=CriterionStatus.COMPLETED if completed else CriterionStatus.PENDING,
-                )
-                criteria.append(criterion)
+            stripped = line.strip()
+            if not stripped.startswith("-"):
+                continue
+
+            box = stripped[1:].lstrip()
+            if len(box) < 4 or box[0] != "[" or box[2] != "]" or box[1] not in " xX":
+                continue
+
+            description = box[3:].strip()
+            completed = box[1] != " "
+            criteria.append(AcceptanceCriterion(
+                description=description,
+                completed=completed,
+                status=CriterionStatus.COMPLETED if completed else CriterionStatus.PENDING,
+            ))
 
         return criteria
 
@@ -247,12 +257,12 @@ class GoalParser:
         items = []
 
         for line in lines:
-            match = self.LIST_PATTERN.match(line.strip())
-            if match:
-                items.append(match.group(1).strip())
-            elif line.strip() and not line.strip().startswith("#"):
+            stripped = line.strip()
+            if stripped.startswith("-") and len(stripped) > 1 and stripped[1].isspace():
+                items.append(stripped[1:].strip())
+            elif stripped and not stripped.startswith("#"):
                 # Non-list content, treat as single item
-                items.append(line.strip())
+                items.append(stripped)
 
         return items
 
@@ -297,28 +307,25 @@ class GoalParser:
         Returns:
             Markdown string
         """
-        lines = [f"# {goal.title}", ""]
+        # One block per section, each rendered with a single join
+        sections = [f"# {goal.title}\n"]
 
         if goal.description:
-            lines.extend(["## Description", "", goal.description, ""])
+            sections.append(f"## Description\n\n{goal.description}\n")
 
         if goal.acceptance_criteria:
-            lines.extend(["## Acceptance Criteria", ""])
-            for c in goal.acceptance_criteria:
-                checkbox = "[x]" if c.completed else "[ ]"
-                lines.append(f"- {checkbox} {c.description}")
-            lines.append("")
+            criteria = "\n".join(
+                f"- [{'x' if c.completed else ' '}] {c.description}"
+                for c in goal.acceptance_criteria
+            )
+            sections.append(f"## Acceptance Criteria\n\n{criteria}\n")
 
         if goal.quality_requirements:
-            lines.extend(["## Quality Requirements", ""])
-            for q in goal.quality_requirements:
-                lines.append(f"- {q}")
-            lines.append("")
+            quality = "\n".join(f"- {q}" for q in goal.quality_requirements)
+            sections.append(f"## Quality Requirements\n\n{quality}\n")
 
         if goal.constraints:
-            lines.extend(["## Constraints", ""])
-            for c in goal.constraints:
-                lines.append(f"- {c}")
-            lines.append("")
+            constraints = "\n".join(f"- {c}" for c in goal.constraints)
+            sections.append(f"## Constraints\n\n{constraints}\n")
 
-        return "\n".join(lines)
+        return "\n".join(sections)
@@ -11,9 +11,26 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is the fallback
+    orjson = None
+
 from .parser import Goal, AcceptanceCriterion, CriterionStatus
 
 
+def _json_line(data: Dict[str, Any]) -> bytes:
+    """Encode one JSONL record, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data).encode("utf-8") + b"\n"
+
+
+def _iterations_log_path(path: Path) -> Path:
+    """Append-only iteration log kept next to a progress file."""
+    return path.with_name(f"{path.stem}.iterations.jsonl")
+
+
 class ProgressState(Enum):
     """Overall progress state"""
     NOT_STARTED = "not_started"
@@ -83,8 +100,8 @@ class ProgressSnapshot:
         """Total duration in seconds"""
         return (self.updated_at - self.started_at).total_seconds()
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+    def to_dict(self, include_iterations: bool = True) -> Dict[str, Any]:
+        data = {
             "goal_title": self.goal_title,
             "state": self.state.value,
             "started_at": self.started_at.isoformat(),
@@ -93,11 +110,14 @@ class ProgressSnapshot:
             "completed_criteria": self.completed_criteria,
             "progress_percentage": self.progress_percentage,
             "current_iteration": self.current_iteration,
-            "iterations": [i.to_dict() for i in self.iterations],
-            "blocked_reason": self.blocked_reason,
-            "criteria_status": self.criteria_status,
-            "duration_seconds": self.duration,
         }
+        # Only built when wanted, auto-saves skip the whole history
+        if include_iterations:
+            data["iterations"] = [i.to_dict() for i in self.iterations]
+        data["blocked_reason"] = self.blocked_reason
+        data["criteria_status"] = self.criteria_status
+        data["duration_seconds"] = self.duration
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProgressSnapshot":
@@ -137,6 +157,10 @@ class ProgressTracker:
         self.session_dir = Path(session_dir) if session_dir else None
         self.auto_save = auto_save
 
+        # Iteration log the next save appends to, and how many records it holds
+        self._log_path: Optional[Path] = None
+        self._logged_iterations = 0
+
         self._snapshot = ProgressSnapshot(
             goal_title=goal.title,
             state=ProgressState.NOT_STARTED,
@@ -278,6 +302,10 @@ class ProgressTracker:
         """
         Save progress to file.
 
+        The snapshot file holds everything except the iterations, which
+        are appended to a JSONL log next to it, so a save only writes the
+        records added since the previous one.
+
         Args:
             path: Optional override path
 
@@ -292,8 +320,21 @@ class ProgressTracker:
         else:
             raise ValueError("No save path available")
 
+        log_path = _iterations_log_path(save_path)
+        iterations = self._snapshot.iterations
+        if log_path != self._log_path:
+            # New destination, start its log from scratch
+            mode, start = "wb", 0
+        else:
+            mode, start = "ab", self._logged_iterations
+        with open(log_path, mode) as f:
+            for record in iterations[start:]:
+                f.write(_json_line(record.to_dict()))
+        self._log_path = log_path
+        self._logged_iterations = len(iterations)
+
         save_path.write_text(
-            json.dumps(self._snapshot.to_dict(), indent=2),
+            json.dumps(self._snapshot.to_dict(include_iterations=False), indent=2),
             encoding="utf-8",
         )
 
@@ -306,8 +347,26 @@ class ProgressTracker:
         Args:
             path: Path to progress file
         """
-        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        load_path = Path(path)
+        data = json.loads(load_path.read_text(encoding="utf-8"))
+
+        # Progress files without an iterations list keep them in the log
+        log_path = _iterations_log_path(load_path)
+        if "iterations" in data:
+            # Inline (legacy) iterations, the first save rewrites the whole log
+            self._log_path = None
+        else:
+            if log_path.exists():
+                with open(log_path, "rb") as f:
+                    data["iterations"] = [
+                        orjson.loads(line) if orjson is not None else json.loads(line)
+                        for line in f
+                        if line.strip()
+                    ]
+            self._log_path = log_path
+
         self._snapshot = ProgressSnapshot.from_dict(data)
+        self._logged_iterations = len(self._snapshot.iterations) if self._log_path else 0
 
     def get_history(self, last_n: Optional[int] = None) -> List[IterationRecord]:
         """
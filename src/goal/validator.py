@@ -4,6 +4,7 @@ Goal Validator
 Validates goal achievement against acceptance criteria.
 """
 
+import json
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Callable
 from enum import Enum
@@ -112,11 +113,7 @@ class GoalValidator:
             ValidationResult
         """
         context = context or {}
-        criteria_results = []
-
-        for criterion in goal.acceptance_criteria:
-            result = self._validate_criterion(criterion, context)
-            criteria_results.append(result)
+        criteria_results = self._validate_criteria(goal.acceptance_criteria, context)
 
         # Calculate overall score
         if criteria_results:
@@ -153,14 +150,48 @@ class GoalValidator:
         Returns:
             CriterionValidation result
         """
-        return self._validate_criterion(criterion, context or {})
+        return self._validate_criteria([criterion], context or {})[0]
+
+    def _validate_criteria(
+        self,
+        criteria: List[AcceptanceCriterion],
+        context: Dict[str, Any],
+    ) -> List[CriterionValidation]:
+        """
+        Validate criteria, sending all that need the agent in one call.
+
+        Results keep the order of criteria.
+        """
+        results: List[Optional[CriterionValidation]] = [
+            self._validate_locally(criterion, context) for criterion in criteria
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
 
-    def _validate_criterion(
+        if pending:
+            if self.agent:
+                verdicts = self._validate_with_agent([criteria[i] for i in pending], context)
+            else:
+                verdicts = [
+                    CriterionValidation(
+                        criterion=criteria[i],
+                        passed=False,
+                        confidence=0.5,
+                        evidence="No validation performed",
+                        issues=["No validator available for this criterion"],
+                    )
+                    for i in pending
+                ]
+            for i, verdict in zip(pending, verdicts):
+                results[i] = verdict
+
+        return results
+
+    def _validate_locally(
         self,
         criterion: AcceptanceCriterion,
         context: Dict[str, Any],
-    ) -> CriterionValidation:
-        """Internal criterion validation."""
+    ) -> Optional[CriterionValidation]:
+        """Validate a criterion without the agent, or None if it needs one."""
         # Check for custom validator
         for tag in criterion.tags:
             if tag in self._custom_validators:
@@ -175,55 +206,52 @@ class GoalValidator:
                 evidence="Marked as completed",
             )
 
-        # Use AI agent if available
-        if self.agent:
-            return self._validate_with_agent(criterion, context)
-
-        # Default: not validated
-        return CriterionValidation(
-            criterion=criterion,
-            passed=False,
-            confidence=0.5,
-            evidence="No validation performed",
-            issues=["No validator available for this criterion"],
-        )
+        return None
 
     def _validate_with_agent(
         self,
-        criterion: AcceptanceCriterion,
+        criteria: List[AcceptanceCriterion],
         context: Dict[str, Any],
-    ) -> CriterionValidation:
-        """Use AI agent to validate criterion."""
+    ) -> List[CriterionValidation]:
+        """Use AI agent to validate criteria in a single call."""
         context_str = self._format_context(context)
+        criteria_str = "\n".join(
+            f"{i}. {criterion.description}" for i, criterion in enumerate(criteria, 1)
+        )
 
-        prompt = f"""Validate if the following acceptance criterion is met.
+        prompt = f"""Validate if each of the following acceptance criteria is met.
 
-CRITERION:
-{criterion.description}
+CRITERIA:
+{criteria_str}
 
 CONTEXT:
 {context_str}
 
-Respond in this exact JSON format:
-{{
-    "passed": true | false,
-    "confidence": 0.0 to 1.0,
-    "evidence": "What evidence supports this conclusion",
-    "issues": ["List of issues if not passed"]
-}}"""
+Respond with one entry per criterion, using its number as id, in this exact JSON format:
+[
+    {{
+        "id": 1,
+        "passed": true | false,
+        "confidence": 0.0 to 1.0,
+        "evidence": "What evidence supports this conclusion",
+        "issues": ["List of issues if not passed"]
+    }}
+]"""
 
         response = self.agent.execute(prompt)
 
         if not response.success:
-            return CriterionValidation(
-                criterion=criterion,
-                passed=False,
-                confidence=0.0,
-                evidence=f"Validation failed: {response.error}",
-            )
+            return [
+                CriterionValidation(
+                    criterion=criterion,
+                    passed=False,
+                    confidence=0.0,
+                    evidence=f"Validation failed: {response.error}",
+                )
+                for criterion in criteria
+            ]
 
         try:
-            import json
             output = response.output.strip()
 
             # Handle markdown code blocks
@@ -233,21 +261,39 @@ Respond in this exact JSON format:
                 output = output.split("```")[1].split("```")[0]
 
             data = json.loads(output)
-
-            return CriterionValidation(
-                criterion=criterion,
-                passed=data.get("passed", False),
-                confidence=float(data.get("confidence", 0.5)),
-                evidence=data.get("evidence", ""),
-                issues=data.get("issues", []),
-            )
+            if isinstance(data, dict):
+                data = [data]
+            verdicts = {str(item.get("id", i)): item for i, item in enumerate(data, 1)}
         except Exception as e:
-            return CriterionValidation(
+            return [
+                CriterionValidation(
+                    criterion=criterion,
+                    passed=False,
+                    confidence=0.0,
+                    evidence=f"Failed to parse validation: {e}",
+                )
+                for criterion in criteria
+            ]
+
+        results = []
+        for i, criterion in enumerate(criteria, 1):
+            verdict = verdicts.get(str(i))
+            if verdict is None:
+                results.append(CriterionValidation(
+                    criterion=criterion,
+                    passed=False,
+                    confidence=0.0,
+                    evidence="No verdict returned for this criterion",
+                ))
+                continue
+            results.append(CriterionValidation(
                 criterion=criterion,
-                passed=False,
-                confidence=0.0,
-                evidence=f"Failed to parse validation: {e}",
-            )
+                passed=verdict.get("passed", False),
+                confidence=float(verdict.get("confidence", 0.5)),
+                evidence=verdict.get("evidence", ""),
+                issues=verdict.get("issues", []),
+            ))
+        return results
 
     def _determine_status(
         self,
@@ -333,7 +379,6 @@ Respond in this exact JSON format:
             if isinstance(value, list):
                 parts.append(f"{key}:\n" + "\n".join(f"  - {v}" for v in value[:10]))
             elif isinstance(value, dict):
-                import json
                 parts.append(f"{key}:\n{json.dumps(value, indent=2)[:500]}")
             else:
                 parts.append(f"{key}: {str(value)[:200]}")
@@ -8,12 +8,18 @@ for role swapping between Claude and Codex.
 import json
 import os
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Deque, Dict, Any, List, Optional, Tuple, Union
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is the fallback
+    orjson = None
+
 from .agents.base import IAgent, AgentType, AgentResponse
 from .agents.factory import AgentFactory
 from .roles.base import (
@@ -41,6 +47,7 @@ class OrchestratorState(Enum):
     PAUSED = "paused"
     VERIFYING = "verifying"
     CORRECTING = "correcting"
+    BLOCKED = "blocked"
     COMPLETED = "completed"
     FAILED = "failed"
 
@@ -51,6 +58,7 @@ class OrchestratorConfig:
     max_iterations: int = 20
     timeout_seconds: int = 300
     checkpoint_interval: int = 5
+    checkpoint_backend: str = "file"  # "file" or "memory"
     strict_verification: bool = True
     max_correction_attempts: int = 3
 
@@ -72,6 +80,7 @@ class OrchestratorConfig:
             "max_iterations": self.max_iterations,
             "timeout_seconds": self.timeout_seconds,
             "checkpoint_interval": self.checkpoint_interval,
+            "checkpoint_backend": self.checkpoint_backend,
             "strict_verification": self.strict_verification,
             "max_correction_attempts": self.max_correction_attempts,
             "master_agent_type": self.master_agent_type.value,
@@ -134,6 +143,65 @@ class SessionState:
         return cls(**data)
 
 
+def _dump_checkpoint(data: Dict[str, Any]) -> bytes:
+    """Encode a checkpoint as indented UTF-8 JSON, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+class FileCheckpointBackend:
+    """Stores checkpoints as files, creating parent directories as needed."""
+
+    def save(self, path: str, data: bytes) -> None:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+
+    def load(self, path: str) -> bytes:
+        return Path(path).read_bytes()
+
+
+class MemoryCheckpointBackend:
+    """
+    Keeps checkpoints in a dict keyed by path, owned by this instance.
+
+    Nothing touches the disk and nothing outlives the instance, which
+    suits tests and short-lived runs but not resuming after a crash.
+    """
+
+    def __init__(self):
+        self._store: Dict[str, bytes] = {}
+
+    def save(self, path: str, data: bytes) -> None:
+        self._store[path] = data
+
+    def load(self, path: str) -> bytes:
+        try:
+            return self._store[path]
+        except KeyError:
+            raise FileNotFoundError(path) from None
+
+
+CheckpointBackend = Union[FileCheckpointBackend, MemoryCheckpointBackend]
+
+_CHECKPOINT_BACKENDS = {
+    "file": FileCheckpointBackend,
+    "memory": MemoryCheckpointBackend,
+}
+
+
+def _create_checkpoint_backend(name: str) -> CheckpointBackend:
+    """Build the checkpoint backend named by OrchestratorConfig.checkpoint_backend."""
+    try:
+        return _CHECKPOINT_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown checkpoint_backend {name!r}, expected one of: "
+            + ", ".join(sorted(_CHECKPOINT_BACKENDS))
+        ) from None
+
+
 class Orchestrator:
     """
     Main orchestrator for AI agent coordination.
@@ -146,6 +214,10 @@ class Orchestrator:
         self,
         config: Optional[OrchestratorConfig] = None,
         goal: Optional[Goal] = None,
+        master_role: Optional[MasterRole] = None,
+        worker_role: Optional[WorkerRole] = None,
+        progress_tracker: Optional[ProgressTracker] = None,
+        checkpoint_backend: Optional[CheckpointBackend] = None,
     ):
         """
         Initialize orchestrator.
@@ -153,6 +225,11 @@ class Orchestrator:
         Args:
             config: Orchestrator configuration
             goal: Goal to achieve (or load from file)
+            master_role: Optional Master role, kept by initialize()
+            worker_role: Optional Worker role, kept by initialize()
+            progress_tracker: Optional tracker, kept by initialize()
+            checkpoint_backend: Optional backend instance, overrides
+                config.checkpoint_backend
         """
         self.config = config or OrchestratorConfig()
         self.goal = goal
@@ -164,19 +241,28 @@ class Orchestrator:
         # Initialize components
         self._master_agent: Optional[IAgent] = None
         self._worker_agent: Optional[IAgent] = None
-        self._master_role: Optional[MasterRole] = None
-        self._worker_role: Optional[WorkerRole] = None
+        self._master_role: Optional[MasterRole] = master_role
+        self._worker_role: Optional[WorkerRole] = worker_role
 
         self._goal_parser = GoalParser()
         self._goal_validator: Optional[GoalValidator] = None
-        self._progress_tracker: Optional[ProgressTracker] = None
+        self._progress_tracker: Optional[ProgressTracker] = progress_tracker
         self._verifier: Optional[VerificationChecker] = None
         self._serializer = JSONSerializer()
+        self._checkpoint_backend = checkpoint_backend or _create_checkpoint_backend(
+            self.config.checkpoint_backend
+        )
 
         # Session state
         self._session: Optional[SessionState] = None
         self._iteration = 0
         self._history: List[Dict[str, Any]] = []
+        # Tail of _history shown to the Master, bounded so it is never sliced
+        self._recent_history: Deque[Dict[str, Any]] = deque()
+        self._resize_recent_history()
+        # Iterations in a row whose corrections failed without raising the score
+        self._consecutive_fails = 0
+        self._best_failed_score = 0.0
 
         self.logger.info(f"Orchestrator initialized with config: {self.config.to_dict()}")
 
@@ -231,21 +317,25 @@ class Orchestrator:
             if not self._worker_agent.is_available():
                 self.logger.warning(f"Worker agent ({self.config.worker_agent_type}) not available")
 
-            # Create roles
-            self._master_role = MasterRole(self._master_agent)
-            self._worker_role = WorkerRole(self._worker_agent)
+            # Create roles unless they were injected
+            if self._master_role is None:
+                self._master_role = MasterRole(self._master_agent)
+            if self._worker_role is None:
+                self._worker_role = WorkerRole(self._worker_agent)
+            self._resize_recent_history()
 
             # Create validators and trackers
             self._goal_validator = GoalValidator(self._master_agent, strict=self.config.strict_verification)
             self._verifier = VerificationChecker(agent=self._master_agent)
 
             # Setup session
-            session_dir = os.path.join(self.config.work_dir, self.config.session_dir)
-            self._progress_tracker = ProgressTracker(
-                self.goal,
-                session_dir=session_dir,
-                auto_save=True,
-            )
+            if self._progress_tracker is None:
+                session_dir = os.path.join(self.config.work_dir, self.config.session_dir)
+                self._progress_tracker = ProgressTracker(
+                    self.goal,
+                    session_dir=session_dir,
+                    auto_save=True,
+                )
 
             # Create session state
             import uuid
@@ -295,7 +385,7 @@ class Orchestrator:
                 decision = self._master_role.decide_next_step(
                     goal_description=self._format_goal_for_master(),
                     current_state=current_state,
-                    history=self._history,
+                    history=self._recent_history,
                 )
 
                 self.logger.info(f"Master decision: {decision.type.value} - {decision.reason[:100]}")
@@ -333,9 +423,17 @@ class Orchestrator:
                 if verification.passed:
                     self.logger.info(f"Verification passed (score: {verification.score:.2f})")
                     self._record_iteration(decision, response, verification)
+                    self._consecutive_fails = 0
                 else:
                     self.logger.warning(f"Verification failed: {verification.issues}")
-                    self._handle_verification_failure(instruction, response, verification)
+                    verification = self._handle_verification_failure(instruction, response, verification)
+                    if self._is_stalled(verification):
+                        reason = f"No progress after {self._consecutive_fails} failed iterations"
+                        self.logger.warning(reason)
+                        self.state = OrchestratorState.BLOCKED
+                        self._progress_tracker.mark_blocked(reason)
+                        self._save_checkpoint()
+                        return False
 
                 # Checkpoint
                 if self._iteration % self.config.checkpoint_interval == 0:
@@ -384,6 +482,7 @@ class Orchestrator:
         # Recreate roles with swapped agents
         self._master_role = MasterRole(self._master_agent)
         self._worker_role = WorkerRole(self._worker_agent)
+        self._resize_recent_history()
 
         # Update validator
         self._goal_validator = GoalValidator(
@@ -428,8 +527,8 @@ class Orchestrator:
         instruction: Instruction,
         response: AgentResponse,
         verification: VerificationResult,
-    ) -> None:
-        """Handle a failed verification"""
+    ) -> VerificationResult:
+        """Handle a failed verification, returning the last verification"""
         self.state = OrchestratorState.CORRECTING
 
         for attempt in range(self.config.max_correction_attempts):
@@ -455,7 +554,7 @@ class Orchestrator:
                     verification,
                 )
                 self.state = OrchestratorState.RUNNING
-                return
+                return verification
 
         self.logger.warning("Max correction attempts reached")
         self._record_iteration(
@@ -464,17 +563,44 @@ class Orchestrator:
             verification,
         )
         self.state = OrchestratorState.RUNNING
+        return verification
+
+    def _is_stalled(self, verification: VerificationResult) -> bool:
+        """
+        Track verification outcomes after a correction cycle.
+
+        Returns True once max_correction_attempts iterations in a row
+        have failed without beating the best score of the streak.
+        """
+        if verification.passed:
+            self._consecutive_fails = 0
+            return False
+
+        if self._consecutive_fails and verification.score > self._best_failed_score:
+            # Still failing, but getting closer, start counting again
+            self._consecutive_fails = 0
+        if not self._consecutive_fails:
+            self._best_failed_score = verification.score
+        self._consecutive_fails += 1
+        return self._consecutive_fails >= self.config.max_correction_attempts
+
+    def _resize_recent_history(self) -> None:
+        """Rebuild the recent-history tail with the current Master's window"""
+        window = getattr(self._master_role, "history_window", MasterRole.history_window)
+        self._recent_history = deque(self._history[-window:] if window else (), maxlen=window)
 
     def _get_current_state(self) -> Dict[str, Any]:
         """Get current state for master decision"""
+        # One pass over the criteria gives both the pending list and the counts
+        pending = self.goal.get_pending_criteria()
+        total = self.goal.total_criteria
+        completed = total - len(pending)
         return {
             "iteration": self._iteration,
-            "goal_progress": self.goal.progress_percentage,
-            "completed_criteria": self.goal.completed_criteria,
-            "total_criteria": self.goal.total_criteria,
-            "pending_criteria": [
-                c.description for c in self.goal.get_pending_criteria()
-            ],
+            "goal_progress": (completed / total) * 100 if total else 0.0,
+            "completed_criteria": completed,
+            "total_criteria": total,
+            "pending_criteria": [c.description for c in pending],
             "last_success": (
                 self._history[-1].get("success", True) if self._history else True
             ),
@@ -522,6 +648,7 @@ class Orchestrator:
         }
 
         self._history.append(record)
+        self._recent_history.append(record)
 
         # Update progress tracker
         if response:
@@ -543,12 +670,9 @@ class Orchestrator:
         self._session.history = self._history
 
         session_dir = Path(self.config.work_dir) / self.config.session_dir
-        session_dir.mkdir(parents=True, exist_ok=True)
-
         checkpoint_path = session_dir / f"checkpoint_{self._session.session_id}.json"
-        checkpoint_path.write_text(
-            json.dumps(self._session.to_dict(), indent=2),
-            encoding="utf-8",
+        self._checkpoint_backend.save(
+            str(checkpoint_path), _dump_checkpoint(self._session.to_dict())
         )
 
         self.logger.info(f"Checkpoint saved: {checkpoint_path}")
@@ -557,10 +681,12 @@ class Orchestrator:
     def _load_checkpoint(self, path: str) -> bool:
         """Load checkpoint"""
         try:
-            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            payload = self._checkpoint_backend.load(path)
+            data = orjson.loads(payload) if orjson is not None else json.loads(payload)
             self._session = SessionState.from_dict(data)
             self._iteration = self._session.iteration
             self._history = self._session.history
+            self._resize_recent_history()
             self.config = OrchestratorConfig.from_dict(self._session.config)
 
             # Reinitialize components
@@ -4,10 +4,22 @@ Protocol Messages
 Message types for communication between Master and Worker.
 """
 
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, List, Optional
+from functools import cached_property
+from typing import Dict, Any, List, Mapping, Optional
+
+
+def _new_id() -> str:
+    """Short random message id"""
+    return uuid.uuid4().hex[:8]
+
+
+# Id and clock sources for new messages, module-level so tests can swap them
+_id_generator = _new_id
+_now = datetime.now
 
 
 class MessageType(Enum):
@@ -34,7 +46,7 @@ class Message:
     """Base message class"""
     type: MessageType
     id: str = ""
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=lambda: _now())
     sender: str = ""
     recipient: str = ""
     correlation_id: Optional[str] = None
@@ -43,14 +55,18 @@ class Message:
 
     def __post_init__(self):
         if not self.id:
-            import uuid
-            self.id = str(uuid.uuid4())[:8]
+            self.id = _id_generator()
+
+    @cached_property
+    def timestamp_iso(self) -> str:
+        """ISO formatted timestamp, computed once per message"""
+        return self.timestamp.isoformat()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "type": self.type.value,
             "id": self.id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "sender": self.sender,
             "recipient": self.recipient,
             "correlation_id": self.correlation_id,
@@ -67,6 +83,12 @@ class Message:
             data["timestamp"] = datetime.fromisoformat(data["timestamp"])
         return cls(**data)
 
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "Message":
+        """Create from an already parsed mapping, ignoring keys that aren't fields"""
+        fields = cls.__dataclass_fields__
+        return cls.from_dict({k: v for k, v in data.items() if k in fields})
+
 
 @dataclass
 class RequestMessage(Message):
@@ -85,8 +107,15 @@ class RequestMessage(Message):
         super().__post_init__()
 
     def to_dict(self) -> Dict[str, Any]:
-        base = super().to_dict()
-        base.update({
+        return {
+            "type": self.type.value,
+            "id": self.id,
+            "timestamp": self.timestamp_iso,
+            "sender": self.sender,
+            "recipient": self.recipient,
+            "correlation_id": self.correlation_id,
+            "priority": self.priority.value,
+            "metadata": self.metadata,
             "instruction": self.instruction,
             "context": self.context,
             "expected_outcome": self.expected_outcome,
@@ -95,8 +124,7 @@ class RequestMessage(Message):
             "files_to_create": self.files_to_create,
             "timeout_seconds": self.timeout_seconds,
             "retry_count": self.retry_count,
-        })
-        return base
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RequestMessage":
@@ -125,8 +153,15 @@ class ResponseMessage(Message):
         super().__post_init__()
 
     def to_dict(self) -> Dict[str, Any]:
-        base = super().to_dict()
-        base.update({
+        return {
+            "type": self.type.value,
+            "id": self.id,
+            "timestamp": self.timestamp_iso,
+            "sender": self.sender,
+            "recipient": self.recipient,
+            "correlation_id": self.correlation_id,
+            "priority": self.priority.value,
+            "metadata": self.metadata,
             "success": self.success,
             "output": self.output,
             "files_modified": self.files_modified,
@@ -135,8 +170,7 @@ class ResponseMessage(Message):
             "error": self.error,
             "exit_code": self.exit_code,
             "execution_time": self.execution_time,
-        })
-        return base
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ResponseMessage":
@@ -162,14 +196,20 @@ class ErrorMessage(Message):
         super().__post_init__()
 
     def to_dict(self) -> Dict[str, Any]:
-        base = super().to_dict()
-        base.update({
+        return {
+            "type": self.type.value,
+            "id": self.id,
+            "timestamp": self.timestamp_iso,
+            "sender": self.sender,
+            "recipient": self.recipient,
+            "correlation_id": self.correlation_id,
+            "priority": self.priority.value,
+            "metadata": self.metadata,
             "error_code": self.error_code,
             "error_message": self.error_message,
             "stack_trace": self.stack_trace,
             "recoverable": self.recoverable,
-        })
-        return base
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ErrorMessage":
@@ -196,16 +236,22 @@ class StatusMessage(Message):
         super().__post_init__()
 
     def to_dict(self) -> Dict[str, Any]:
-        base = super().to_dict()
-        base.update({
+        return {
+            "type": self.type.value,
+            "id": self.id,
+            "timestamp": self.timestamp_iso,
+            "sender": self.sender,
+            "recipient": self.recipient,
+            "correlation_id": self.correlation_id,
+            "priority": self.priority.value,
+            "metadata": self.metadata,
             "status": self.status,
             "progress": self.progress,
             "current_task": self.current_task,
             "tasks_completed": self.tasks_completed,
             "tasks_total": self.tasks_total,
             "estimated_remaining": self.estimated_remaining,
-        })
-        return base
+        }
 
 
 @dataclass
@@ -221,14 +267,20 @@ class DecisionMessage(Message):
         super().__post_init__()
 
     def to_dict(self) -> Dict[str, Any]:
-        base = super().to_dict()
-        base.update({
+        return {
+            "type": self.type.value,
+            "id": self.id,
+            "timestamp": self.timestamp_iso,
+            "sender": self.sender,
+            "recipient": self.recipient,
+            "correlation_id": self.correlation_id,
+            "priority": self.priority.value,
+            "metadata": self.metadata,
             "decision_type": self.decision_type,
             "instruction": self.instruction,
             "reason": self.reason,
             "expected_outcome": self.expected_outcome,
-        })
-        return base
+        }
 
 
 @dataclass
@@ -244,14 +296,20 @@ class VerificationMessage(Message):
         super().__post_init__()
 
     def to_dict(self) -> Dict[str, Any]:
-        base = super().to_dict()
-        base.update({
+        return {
+            "type": self.type.value,
+            "id": self.id,
+            "timestamp": self.timestamp_iso,
+            "sender": self.sender,
+            "recipient": self.recipient,
+            "correlation_id": self.correlation_id,
+            "priority": self.priority.value,
+            "metadata": self.metadata,
             "passed": self.passed,
             "score": self.score,
             "issues": self.issues,
             "suggestions": self.suggestions,
-        })
-        return base
+        }
 
 
 class MessageFactory:
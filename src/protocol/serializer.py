@@ -7,9 +7,14 @@ Serialize and deserialize messages in various formats.
 import json
 import re
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Type, Optional, Union
+from typing import Dict, Any, Mapping, Type, Optional, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is the fallback
+    orjson = None
+
 from .messages import (
     Message,
     MessageType,
@@ -35,6 +40,10 @@ class Serializer(ABC):
         """Deserialize string to message"""
         pass
 
+    def serialize_bytes(self, message: Message) -> bytes:
+        """Serialize message to UTF-8 encoded bytes"""
+        return self.serialize(message).encode("utf-8")
+
 
 class JSONSerializer(Serializer):
     """JSON format serializer"""
@@ -63,19 +72,52 @@ class JSONSerializer(Serializer):
         Returns:
             JSON string
         """
+        if orjson is not None and self.indent in (None, 2):
+            return self.serialize_bytes(message).decode("utf-8")
+        # Same format as orjson: raw UTF-8, compact when not indented
         return json.dumps(
             message.to_dict(),
             indent=self.indent,
             sort_keys=self.sort_keys,
             default=self._json_serializer,
+            ensure_ascii=False,
+            separators=(",", ":") if self.indent is None else None,
         )
 
-    def deserialize(self, data: str) -> Message:
+    def serialize_bytes(self, message: Message) -> bytes:
+        """
+        Serialize message to UTF-8 encoded JSON bytes.
+
+        Uses orjson when installed, which encodes straight to bytes
+        without building an intermediate str. orjson only supports an
+        indent of 2, other indents (including 0, which still puts each
+        item on its own line) fall back to the stdlib encoder.
+
+        Args:
+            message: Message to serialize
+
+        Returns:
+            JSON bytes
+        """
+        if orjson is not None and self.indent in (None, 2):
+            option = 0
+            if self.indent:
+                option |= orjson.OPT_INDENT_2
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(
+                message.to_dict(),
+                default=self._json_serializer,
+                option=option,
+            )
+        return self.serialize(message).encode("utf-8")
+
+    def deserialize(self, data: Union[str, bytes]) -> Message:
         """
         Deserialize JSON to message.
 
         Args:
-            data: JSON string
+            data: JSON string or bytes
 
         Returns:
             Message object
@@ -84,17 +126,35 @@ class JSONSerializer(Serializer):
             ValueError: If JSON is invalid or message type unknown
         """
         try:
-            parsed = json.loads(data)
-        except json.JSONDecodeError as e:
+            parsed = orjson.loads(data) if orjson is not None else json.loads(data)
+        except json.JSONDecodeError as e:  # orjson's decode error subclasses it
             raise ValueError(f"Invalid JSON: {e}")
 
-        if "type" not in parsed:
+        return self.deserialize_mapping(parsed)
+
+    def deserialize_mapping(self, data: Mapping[str, Any]) -> Message:
+        """
+        Build a message from an already parsed JSON object.
+
+        Skips the encode/decode round trip for callers that hold a dict.
+        Keys that aren't fields of the message class are ignored.
+
+        Args:
+            data: Parsed message mapping
+
+        Returns:
+            Message object
+
+        Raises:
+            ValueError: If the message type is missing or unknown
+        """
+        if "type" not in data:
             raise ValueError("Message type not specified")
 
-        msg_type = MessageType(parsed["type"])
+        msg_type = MessageType(data["type"])
         msg_class = self.MESSAGE_CLASSES.get(msg_type, Message)
 
-        return msg_class.from_dict(parsed)
+        return msg_class.from_mapping(data)
 
     def _json_serializer(self, obj: Any) -> Any:
         """Custom JSON serializer for special types"""
@@ -127,6 +187,13 @@ class MarkdownSerializer(Serializer):
         "metadata": "---METADATA---",
     }
 
+    # Marker line, surrounding blanks and its newline, capturing the marker name
+    _SECTION_NAMES = {marker.strip("-"): name for name, marker in MARKERS.items()}
+    _SECTION_RE = re.compile(
+        r"^[^\S\n]*---(" + "|".join(map(re.escape, _SECTION_NAMES)) + r")---[^\S\n]*(?:\n|$)",
+        re.MULTILINE,
+    )
+
     def serialize(self, message: Message) -> str:
         """
         Serialize message to Markdown.
@@ -160,7 +227,7 @@ class MarkdownSerializer(Serializer):
         lines.extend([
             f"{self.MARKERS['metadata']}",
             f"ID: {message.id}",
-            f"Timestamp: {message.timestamp.isoformat()}",
+            f"Timestamp: {message.timestamp_iso}",
             f"Sender: {message.sender}",
             f"Recipient: {message.recipient}",
         ])
@@ -296,27 +363,18 @@ class MarkdownSerializer(Serializer):
         """Parse markdown into sections"""
         sections = {}
         current_section = "preamble"
-        current_content = []
-
-        for line in data.split("\n"):
-            # Check for section marker
-            found_marker = False
-            for name, marker in self.MARKERS.items():
-                if line.strip() == marker:
-                    # Save previous section
-                    if current_content:
-                        sections[current_section] = "\n".join(current_content).strip()
-                    current_section = name
-                    current_content = []
-                    found_marker = True
-                    break
-
-            if not found_marker:
-                current_content.append(line)
-
-        # Save last section
-        if current_content:
-            sections[current_section] = "\n".join(current_content).strip()
+        start = 0
+
+        for match in self._SECTION_RE.finditer(data):
+            # Sections with no lines before the next marker are dropped
+            if match.start() > start:
+                sections[current_section] = data[start:match.start()].strip()
+            current_section = self._SECTION_NAMES[match.group(1)]
+            start = match.end()
+
+        # The last section has a line unless the data ends on a marker
+        if start == 0 or start < len(data) or data[start - 1] == "\n":
+            sections[current_section] = data[start:].strip()
 
         return sections
 
@@ -405,13 +463,14 @@ class SerializerFactory:
         Returns:
             Appropriate Serializer
         """
-        data = data.strip()
+        # Dispatch on the first non-blank character, without copying data
+        first = next((ch for ch in data if not ch.isspace()), "")
 
         # JSON starts with { or [
-        if data.startswith(("{", "[")):
+        if first in ("{", "["):
             return JSONSerializer()
 
-        # Markdown has section markers
+        # Markdown has section markers, usually found at the very start
         if "---" in data:
             return MarkdownSerializer()
 
@@ -3,6 +3,7 @@
 from .master import MasterRole
 from .worker import WorkerRole
 from .base import IRoleStrategy, Decision, DecisionType, VerificationResult
+from .cache import ResponseCache
 
 __all__ = [
     "MasterRole",
@@ -11,4 +12,5 @@ __all__ = [
     "Decision",
     "DecisionType",
     "VerificationResult",
+    "ResponseCache",
 ]
@@ -4,10 +4,12 @@ Base Role Strategy Interface and Data Classes
 Defines the contract for Master and Worker roles.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from functools import cached_property
+from typing import Dict, Any, Optional, List, FrozenSet, Sequence, Tuple
 from datetime import datetime
 
 from ..agents.base import IAgent, AgentResponse
@@ -23,7 +25,7 @@ class DecisionType(Enum):
     CORRECT = "correct"      # Apply correction
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Decision:
     """A decision made by the Master role"""
     type: DecisionType
@@ -54,7 +56,7 @@ class Decision:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerificationResult:
     """Result of verifying a Worker's implementation"""
     passed: bool
@@ -73,9 +75,19 @@ class VerificationResult:
         }
 
 
-@dataclass
+def _bullet_list(items: List[str]) -> str:
+    """Render items as "- item" lines."""
+    return "\n".join(f"- {item}" for item in items)
+
+
+@dataclass(frozen=True)
 class Instruction:
-    """An instruction from Master to Worker"""
+    """
+    An instruction from Master to Worker.
+
+    Frozen so corrections can share the original's lists instead of
+    copying them. Not slotted, the cached prompt blocks need __dict__.
+    """
     prompt: str
     context: str = ""
     files_to_modify: List[str] = field(default_factory=list)
@@ -84,6 +96,26 @@ class Instruction:
     expected_outcome: str = ""
     max_attempts: int = 3
 
+    @cached_property
+    def files_to_create_set(self) -> FrozenSet[str]:
+        """files_to_create as a set, for membership checks"""
+        return frozenset(self.files_to_create)
+
+    @cached_property
+    def files_to_modify_block(self) -> str:
+        """files_to_modify rendered as a prompt bullet list"""
+        return _bullet_list(self.files_to_modify)
+
+    @cached_property
+    def files_to_create_block(self) -> str:
+        """files_to_create rendered as a prompt bullet list"""
+        return _bullet_list(self.files_to_create)
+
+    @cached_property
+    def constraints_block(self) -> str:
+        """constraints rendered as a prompt bullet list"""
+        return _bullet_list(self.constraints)
+
 
 class IRoleStrategy(ABC):
     """
@@ -108,7 +140,7 @@ class IRoleStrategy(ABC):
         self,
         goal_description: str,
         current_state: Dict[str, Any],
-        history: List[Dict[str, Any]],
+        history: Sequence[Dict[str, Any]],
     ) -> Decision:
         """
         Decide what the next step should be.
@@ -172,6 +204,48 @@ class IRoleStrategy(ABC):
         """
         pass
 
+    async def a_verify_implementation(
+        self,
+        instruction: Instruction,
+        response: AgentResponse,
+    ) -> VerificationResult:
+        """
+        Verify an implementation without blocking the event loop.
+
+        Args:
+            instruction: The original instruction
+            response: The implementation response
+
+        Returns:
+            VerificationResult with pass/fail and details
+        """
+        return await asyncio.to_thread(self.verify_implementation, instruction, response)
+
+    async def a_verify_all(
+        self,
+        pairs: List[Tuple[Instruction, AgentResponse]],
+        max_concurrency: int = 5,
+    ) -> List[VerificationResult]:
+        """
+        Verify independent implementations concurrently.
+
+        Args:
+            pairs: (instruction, response) pairs to verify
+            max_concurrency: Maximum number of verifications in flight
+
+        Returns:
+            VerificationResults in the same order as pairs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def verify(instruction: Instruction, response: AgentResponse) -> VerificationResult:
+            async with semaphore:
+                return await self.a_verify_implementation(instruction, response)
+
+        return list(await asyncio.gather(
+            *(verify(instruction, response) for instruction, response in pairs)
+        ))
+
     def increment_iteration(self) -> int:
         """Increment and return iteration count"""
         self._iteration_count += 1
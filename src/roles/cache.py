@@ -0,0 +1,142 @@
+"""
+Response Cache
+
+Caches agent outputs for prompts that were already answered, so repeated
+orchestration states don't pay for another agent round-trip.
+"""
+
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of agent outputs keyed by prompt.
+
+    Prompts are normalized before lookup, so prompts that only differ
+    in trailing whitespace share one entry. Indentation and line breaks
+    are kept, since verify prompts embed code where they matter. Entries are keyed by the SHA-256
+    digest of the normalized prompt, which keeps memory per entry
+    independent of prompt length. Safe to share between threads.
+
+    Frequently hit entries are periodically promoted from the LRU tier
+    into a small frequency-ranked hot tier, so recurring prompts are not
+    pushed out by a burst of one-off prompts.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        hot_size: int = 32,
+        promote_after: int = 3,
+        promote_interval: int = 50,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of LRU entries, 0 disables caching
+            hot_size: Maximum number of promoted entries
+            promote_after: Hits an entry needs before it can be promoted
+            promote_interval: Lookups between promotion passes
+        """
+        self.max_size = max_size
+        self.hot_size = hot_size
+        self.promote_after = promote_after
+        self.promote_interval = promote_interval
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._hot: Dict[str, str] = {}
+        self._hit_counts: Counter = Counter()
+        self._lookups = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(prompt: str) -> str:
+        """Strip trailing whitespace per line, keeping indentation intact."""
+        return "\n".join(line.rstrip() for line in prompt.rstrip().splitlines())
+
+    @classmethod
+    def key_for(cls, prompt: str) -> str:
+        """Return the cache key for a prompt."""
+        return hashlib.sha256(cls.normalize(prompt).encode("utf-8")).hexdigest()
+
+    def get(self, prompt: str) -> Optional[str]:
+        """
+        Look up the cached output for a prompt.
+
+        Args:
+            prompt: Prompt that was sent to the agent
+
+        Returns:
+            Cached output or None on a miss
+        """
+        key = self.key_for(prompt)
+        with self._lock:
+            self._lookups += 1
+            if self._lookups % self.promote_interval == 0:
+                self._promote()
+
+            output = self._hot.get(key)
+            if output is None:
+                output = self._entries.get(key)
+                if output is None:
+                    self.misses += 1
+                    return None
+                self._entries.move_to_end(key)
+
+            self._hit_counts[key] += 1
+            self.hits += 1
+            return output
+
+    def put(self, prompt: str, output: str) -> None:
+        """
+        Store the output for a prompt, evicting the least recently used entry.
+
+        Args:
+            prompt: Prompt that was sent to the agent
+            output: Output the agent produced
+        """
+        if self.max_size <= 0:
+            return
+
+        key = self.key_for(prompt)
+        with self._lock:
+            if key in self._hot:
+                self._hot[key] = output
+                return
+
+            self._entries[key] = output
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                self._hit_counts.pop(evicted, None)
+
+    def _promote(self) -> None:
+        """Move the most frequently hit LRU entries into the hot tier."""
+        for key, count in self._hit_counts.most_common():
+            if count < self.promote_after:
+                break
+            if key in self._entries:
+                self._hot[key] = self._entries.pop(key)
+
+        # Keep only the most frequently hit entries in the hot tier
+        while len(self._hot) > self.hot_size:
+            coldest = min(self._hot, key=lambda k: self._hit_counts[k])
+            del self._hot[coldest]
+            self._hit_counts.pop(coldest, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._hot.clear()
+            self._hit_counts.clear()
+            self._lookups = 0
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._hot)
@@ -8,8 +8,16 @@ The Master role is responsible for:
 - Creating corrections when needed
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import asyncio
 import json
+import re
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is the fallback
+    orjson = None
 
 from ..agents.base import IAgent, AgentResponse, AgentCapability
 from .base import (
@@ -19,6 +27,110 @@ from .base import (
     VerificationResult,
     Instruction,
 )
+from .cache import ResponseCache
+
+
+# Markdown code fences around JSON answers; a missing closing fence runs to the end
+_JSON_FENCE_RE = re.compile(r"```json(.*?)(?:```|\Z)", re.DOTALL)
+_FENCE_RE = re.compile(r"```(.*?)(?:```|\Z)", re.DOTALL)
+
+# A DONE/SKIP decision is settled once its type and reason are complete
+_SETTLED_DECISION_RE = re.compile(r'"decision_type"\s*:\s*"(DONE|SKIP)"', re.IGNORECASE)
+_REASON_RE = re.compile(r'"reason"\s*:\s*"((?:[^"\\]|\\.)*)"', re.DOTALL)
+_DECISION_TYPE_RE = re.compile(r'"decision_type"\s*:\s*"(\w+)"')
+_SETTLED_TYPES = frozenset({DecisionType.DONE, DecisionType.SKIP})
+
+# Characters of earlier output kept while looking for the decision type, so
+# a "decision_type": "..." pair split across chunks is still found
+_TYPE_SCAN_OVERLAP = 64
+
+
+# Keyed by both the upper and lower case spelling, so the usual answers
+# resolve with one lookup and only mixed case needs normalizing.
+_DECISION_TYPES = {
+    **{t.value: t for t in DecisionType},
+    **{t.value.upper(): t for t in DecisionType},
+}
+
+
+def _decision_type(raw: str) -> DecisionType:
+    """Map a decision_type answer to a DecisionType, ERROR if unknown."""
+    decision_type = _DECISION_TYPES.get(raw)
+    if decision_type is None:
+        decision_type = _DECISION_TYPES.get(raw.upper(), DecisionType.ERROR)
+    return decision_type
+
+
+# String-valued decision fields. Inside a JSON string every quote is
+# escaped, so a key followed by an unescaped quote is always structural.
+_DECISION_FIELD_RE = re.compile(
+    r'"(decision_type|instruction|reason|expected_outcome)"\s*:\s*"((?:[^"\\]|\\.)*)"'
+)
+
+
+def _scan_decision_fields(output: str) -> Optional[Dict[str, str]]:
+    """
+    Extract decision fields from a bare JSON object in one regex pass.
+
+    Returns None when the output is fenced or wrapped in prose, or has no
+    decision_type, so the caller can fall back to a full JSON parse.
+    """
+    output = output.strip()
+    if not (output.startswith("{") and output.endswith("}")):
+        return None
+
+    fields = {}
+    for match in _DECISION_FIELD_RE.finditer(output):
+        value = match.group(2)
+        if "\\" in value:
+            value = json.loads(f'"{value}"')
+        fields[match.group(1)] = value
+
+    return fields if "decision_type" in fields else None
+
+
+def _load_json_output(output: str) -> Any:
+    """Parse JSON from agent output, unwrapping a markdown code block if present."""
+    match = _JSON_FENCE_RE.search(output) or _FENCE_RE.search(output)
+    payload = match.group(1) if match else output
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+# Static prompt scaffolding goes first so providers can reuse the cached
+# prefix; the per-call goal, state and results are appended after it.
+_DECIDE_PROMPT_PREFIX = """You are the MASTER in an AI orchestration system.
+Your job is to decide the next step toward achieving a goal.
+
+Respond in this exact JSON format:
+{
+    "decision_type": "IMPLEMENT" | "SKIP" | "DONE" | "RETRY" | "CORRECT",
+    "instruction": "Detailed instruction for the worker (if IMPLEMENT/CORRECT/RETRY)",
+    "reason": "Why this decision was made",
+    "expected_outcome": "What should result from this step"
+}
+
+Rules:
+- Use DONE if the goal is achieved
+- Use IMPLEMENT for new work
+- Use SKIP if a step is unnecessary
+- Use RETRY if the last step failed but should be retried
+- Use CORRECT if the last step had issues that need fixing
+"""
+
+_VERIFY_PROMPT_PREFIX = """You are verifying an implementation.
+
+Verify the implementation and respond in this exact JSON format:
+{
+    "passed": true | false,
+    "score": 0.0 to 1.0,
+    "issues": ["list of issues if any"],
+    "suggestions": ["list of improvement suggestions"]
+}
+
+Be thorough but fair in your assessment.
+"""
 
 
 class MasterRole(IRoleStrategy):
@@ -29,9 +141,19 @@ class MasterRole(IRoleStrategy):
     Can be assigned to either Claude or Codex.
     """
 
-    def __init__(self, agent: IAgent):
+    # Number of most recent steps included in the decision prompt
+    history_window: int = 5
+
+    def __init__(
+        self,
+        agent: IAgent,
+        cache_size: int = 128,
+        stream_decisions: bool = False,
+    ):
         super().__init__(agent)
-        self._analysis_cache: Dict[str, str] = {}
+        self._response_cache = ResponseCache(max_size=cache_size)
+        self.stream_decisions = stream_decisions
+        self._inflight: Dict[str, "asyncio.Future[VerificationResult]"] = {}
 
     @property
     def role_name(self) -> str:
@@ -41,7 +163,7 @@ class MasterRole(IRoleStrategy):
         self,
         goal_description: str,
         current_state: Dict[str, Any],
-        history: List[Dict[str, Any]],
+        history: Sequence[Dict[str, Any]],
     ) -> Decision:
         """
         Analyze state and decide next step toward goal.
@@ -53,9 +175,7 @@ class MasterRole(IRoleStrategy):
         history_summary = self._summarize_history(history)
         state_summary = self._format_state(current_state)
 
-        prompt = f"""You are the MASTER in an AI orchestration system.
-Your job is to decide the next step toward achieving a goal.
-
+        prompt = f"""{_DECIDE_PROMPT_PREFIX}
 GOAL:
 {goal_description}
 
@@ -65,41 +185,42 @@ CURRENT STATE:
 HISTORY OF PREVIOUS STEPS:
 {history_summary}
 
-Based on this information, decide what to do next.
+Based on this information, decide what to do next."""
 
-Respond in this exact JSON format:
-{{
-    "decision_type": "IMPLEMENT" | "SKIP" | "DONE" | "RETRY" | "CORRECT",
-    "instruction": "Detailed instruction for the worker (if IMPLEMENT/CORRECT/RETRY)",
-    "reason": "Why this decision was made",
-    "expected_outcome": "What should result from this step"
-}}
-
-Rules:
-- Use DONE if the goal is achieved
-- Use IMPLEMENT for new work
-- Use SKIP if a step is unnecessary
-- Use RETRY if the last step failed but should be retried
-- Use CORRECT if the last step had issues that need fixing"""
-
-        response = self.agent.execute(prompt)
-
-        if not response.success:
-            return Decision(
-                type=DecisionType.ERROR,
-                reason=f"Failed to decide: {response.error}",
-            )
+        output = self._response_cache.get(prompt)
+        if output is None and self.stream_decisions:
+            try:
+                output, settled = self._stream_decision(prompt)
+            except Exception as e:
+                return Decision(
+                    type=DecisionType.ERROR,
+                    reason=f"Failed to decide: {e}",
+                )
+            if settled:
+                return settled
+        elif output is None:
+            response = self.agent.execute(prompt)
+
+            if not response.success:
+                return Decision(
+                    type=DecisionType.ERROR,
+                    reason=f"Failed to decide: {response.error}",
+                )
+            output = response.output
 
         # Parse response
         try:
-            parsed = self._parse_decision_response(response.output)
-            return parsed
+            parsed = self._parse_decision_response(output)
         except Exception as e:
             return Decision(
                 type=DecisionType.ERROR,
                 reason=f"Failed to parse decision: {e}",
             )
 
+        # Only cache outputs that parsed, so a bad answer can be retried
+        self._response_cache.put(prompt, output)
+        return parsed
+
     def implement_step(self, instruction: Instruction) -> AgentResponse:
         """
         Master doesn't typically implement, but can if needed.
@@ -114,7 +235,7 @@ Context: {instruction.context}
 Expected outcome: {instruction.expected_outcome}
 
 Constraints:
-{chr(10).join('- ' + c for c in instruction.constraints) if instruction.constraints else 'None'}
+{instruction.constraints_block or 'None'}
 
 Files to modify: {', '.join(instruction.files_to_modify) if instruction.files_to_modify else 'As needed'}
 Files to create: {', '.join(instruction.files_to_create) if instruction.files_to_create else 'As needed'}"""
@@ -129,8 +250,62 @@ Files to create: {', '.join(instruction.files_to_create) if instruction.files_to
         """
         Verify that Worker's implementation meets expectations.
         """
-        prompt = f"""You are verifying an implementation.
+        prompt = self._build_verification_prompt(instruction, response)
+
+        output = self._response_cache.get(prompt)
+        if output is None:
+            verify_response = self.agent.execute(prompt)
 
+            if not verify_response.success:
+                return VerificationResult(
+                    passed=False,
+                    score=0.0,
+                    issues=[f"Verification failed: {verify_response.error}"],
+                )
+            output = verify_response.output
+
+        try:
+            result = self._parse_verification_response(output)
+        except Exception as e:
+            return VerificationResult(
+                passed=False,
+                score=0.0,
+                issues=[f"Failed to parse verification: {e}"],
+            )
+
+        self._response_cache.put(prompt, output)
+        return result
+
+    async def a_verify_implementation(
+        self,
+        instruction: Instruction,
+        response: AgentResponse,
+    ) -> VerificationResult:
+        """
+        Verify without blocking the event loop.
+
+        Concurrent calls for the same prompt share one in-flight
+        verification instead of each querying the agent.
+        """
+        key = ResponseCache.key_for(self._build_verification_prompt(instruction, response))
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                super().a_verify_implementation(instruction, response)
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so one cancelled caller doesn't cancel the others
+        return await asyncio.shield(future)
+
+    def _build_verification_prompt(
+        self,
+        instruction: Instruction,
+        response: AgentResponse,
+    ) -> str:
+        """Build the prompt for verifying a single implementation."""
+        return f"""{_VERIFY_PROMPT_PREFIX}
 ORIGINAL INSTRUCTION:
 {instruction.prompt}
 
@@ -142,35 +317,81 @@ Success: {response.success}
 Output: {response.output}
 Files Modified: {', '.join(response.files_modified)}
 Files Created: {', '.join(response.files_created)}
-Errors: {response.error or 'None'}
+Errors: {response.error or 'None'}"""
 
-Verify the implementation and respond in this exact JSON format:
-{{
-    "passed": true | false,
-    "score": 0.0 to 1.0,
-    "issues": ["list of issues if any"],
-    "suggestions": ["list of improvement suggestions"]
-}}
+    def verify_implementations(
+        self,
+        pairs: List[Tuple[Instruction, AgentResponse]],
+    ) -> List[VerificationResult]:
+        """
+        Verify several Worker implementations with a single agent call.
+
+        Returns one VerificationResult per pair, in the same order.
+        """
+        if not pairs:
+            return []
+        if len(pairs) == 1:
+            return [self.verify_implementation(*pairs[0])]
+
+        blocks = []
+        for i, (instruction, response) in enumerate(pairs, 1):
+            blocks.append(f"""IMPLEMENTATION #{i}:
+ORIGINAL INSTRUCTION:
+{instruction.prompt}
+
+EXPECTED OUTCOME:
+{instruction.expected_outcome}
+
+IMPLEMENTATION RESULT:
+Success: {response.success}
+Output: {response.output}
+Files Modified: {', '.join(response.files_modified)}
+Files Created: {', '.join(response.files_created)}
+Errors: {response.error or 'None'}""")
+
+        implementations = "\n\n".join(blocks)
+
+        prompt = f"""You are verifying {len(pairs)} independent implementations.
+
+{implementations}
+
+Verify each implementation and respond with a JSON array containing
+one object per implementation, in this exact format:
+[
+    {{
+        "id": implementation number,
+        "passed": true | false,
+        "score": 0.0 to 1.0,
+        "issues": ["list of issues if any"],
+        "suggestions": ["list of improvement suggestions"]
+    }}
+]
 
 Be thorough but fair in your assessment."""
 
         verify_response = self.agent.execute(prompt)
 
         if not verify_response.success:
-            return VerificationResult(
-                passed=False,
-                score=0.0,
-                issues=[f"Verification failed: {verify_response.error}"],
-            )
+            return [
+                VerificationResult(
+                    passed=False,
+                    score=0.0,
+                    issues=[f"Verification failed: {verify_response.error}"],
+                )
+                for _ in pairs
+            ]
 
         try:
-            return self._parse_verification_response(verify_response.output)
+            return self._parse_verification_list(verify_response.output, len(pairs))
         except Exception as e:
-            return VerificationResult(
-                passed=False,
-                score=0.0,
-                issues=[f"Failed to parse verification: {e}"],
-            )
+            return [
+                VerificationResult(
+                    passed=False,
+                    score=0.0,
+                    issues=[f"Failed to parse verification: {e}"],
+                )
+                for _ in pairs
+            ]
 
     def create_correction(
         self,
@@ -241,32 +462,38 @@ Respond in JSON format."""
 
         if response.success:
             try:
-                return json.loads(response.output)
-            except json.JSONDecodeError:
-                return {"analysis": response.output}
+                data = _load_json_output(response.output)
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                return data
+            return {"analysis": response.output}
         return {"error": response.error}
 
-    def _summarize_history(self, history: List[Dict[str, Any]]) -> str:
+    def _summarize_history(self, history: Sequence[Dict[str, Any]]) -> str:
         """Summarize iteration history."""
         if not history:
             return "No previous steps."
 
-        summaries = []
-        for i, item in enumerate(history[-5:], 1):  # Last 5 items
-            status = "SUCCESS" if item.get("success", False) else "FAILED"
-            summaries.append(
-                f"Step {i}: {item.get('instruction', 'N/A')[:100]}... [{status}]"
-            )
+        # A bounded recent-history window is used as is. A longer sequence
+        # (list or deque) is read from the end, so only the tail is visited
+        if len(history) > self.history_window:
+            history = list(islice(reversed(history), self.history_window))[::-1]
 
-        return "\n".join(summaries)
+        return "\n".join(
+            f"Step {i}: {item.get('instruction', 'N/A')[:100]}... "
+            f"[{'SUCCESS' if item.get('success', False) else 'FAILED'}]"
+            for i, item in enumerate(history, 1)
+        )
 
     def _format_state(self, state: Dict[str, Any]) -> str:
         """Format current state for prompt."""
         if not state:
             return "Initial state - no previous work."
 
+        # Sorted so equal states always render (and cache) identically
         lines = []
-        for key, value in state.items():
+        for key, value in sorted(state.items()):
             if isinstance(value, list):
                 lines.append(f"{key}: {', '.join(str(v) for v in value[:5])}")
             else:
@@ -274,33 +501,70 @@ Respond in JSON format."""
 
         return "\n".join(lines)
 
+    def _stream_decision(self, prompt: str) -> Tuple[str, Optional[Decision]]:
+        """
+        Stream the decision, stopping as soon as a DONE/SKIP is settled.
+
+        Returns:
+            Output received so far and the settled Decision, if any
+        """
+        parts: List[str] = []
+        # Only the last few characters are scanned until the type is known,
+        # the full text is only assembled once a DONE/SKIP needs its reason
+        tail = ""
+        received: Optional[str] = None
+        scanning = True
+        stream = self.agent.execute_stream(prompt)
+        try:
+            for chunk in stream:
+                parts.append(chunk)
+                if not scanning:
+                    continue
+                if received is None:
+                    window = tail + chunk
+                    type_match = _DECISION_TYPE_RE.search(window)
+                    if not type_match:
+                        tail = window[-_TYPE_SCAN_OVERLAP:]
+                        continue
+                    if _decision_type(type_match.group(1)) not in _SETTLED_TYPES:
+                        scanning = False  # Only the full output can be parsed
+                        continue
+                    received = "".join(parts)
+                else:
+                    received += chunk
+                settled = self._settled_decision(received)
+                if settled:
+                    return received, settled
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+
+        return "".join(parts), None
+
+    def _settled_decision(self, partial: str) -> Optional[Decision]:
+        """Build a DONE/SKIP Decision from partial output, if already complete."""
+        type_match = _SETTLED_DECISION_RE.search(partial)
+        if not type_match:
+            return None
+
+        reason_match = _REASON_RE.search(partial)
+        if not reason_match:
+            return None
+
+        return Decision(
+            type=DecisionType(type_match.group(1).lower()),
+            reason=json.loads(f'"{reason_match.group(1)}"'),
+        )
+
     def _parse_decision_response(self, output: str) -> Decision:
         """Parse JSON decision response."""
-        # Try to extract JSON from response
-        output = output.strip()
-
-        # Handle markdown code blocks
-        if "```json" in output:
-            output = output.split("```json")[1].split("```")[0]
-        elif "```" in output:
-            output = output.split("```")[1].split("```")[0]
-
-        data = json.loads(output)
-
-        decision_type_map = {
-            "IMPLEMENT": DecisionType.IMPLEMENT,
-            "SKIP": DecisionType.SKIP,
-            "DONE": DecisionType.DONE,
-            "RETRY": DecisionType.RETRY,
-            "CORRECT": DecisionType.CORRECT,
-            "ERROR": DecisionType.ERROR,
-        }
+        data = _scan_decision_fields(output)
+        if data is None:
+            data = _load_json_output(output)
 
         return Decision(
-            type=decision_type_map.get(
-                data.get("decision_type", "").upper(),
-                DecisionType.ERROR,
-            ),
+            type=_decision_type(data.get("decision_type", "")),
             instruction=data.get("instruction", ""),
             reason=data.get("reason", ""),
             expected_outcome=data.get("expected_outcome", ""),
@@ -308,14 +572,7 @@ Respond in JSON format."""
 
     def _parse_verification_response(self, output: str) -> VerificationResult:
         """Parse JSON verification response."""
-        output = output.strip()
-
-        if "```json" in output:
-            output = output.split("```json")[1].split("```")[0]
-        elif "```" in output:
-            output = output.split("```")[1].split("```")[0]
-
-        data = json.loads(output)
+        data = _load_json_output(output)
 
         return VerificationResult(
             passed=data.get("passed", False),
@@ -323,3 +580,33 @@ Respond in JSON format."""
             issues=data.get("issues", []),
             suggestions=data.get("suggestions", []),
         )
+
+    def _parse_verification_list(self, output: str, count: int) -> List[VerificationResult]:
+        """Parse JSON array verification response for a batch."""
+        data = _load_json_output(output)
+        if not isinstance(data, list):
+            raise ValueError("Expected a JSON array")
+
+        by_id = {}
+        for position, item in enumerate(data, 1):
+            by_id[int(item.get("id", position))] = item
+
+        results = []
+        for i in range(1, count + 1):
+            item = by_id.get(i)
+            if item is None:
+                results.append(VerificationResult(
+                    passed=False,
+                    score=0.0,
+                    issues=[f"No verification returned for implementation #{i}"],
+                ))
+                continue
+
+            results.append(VerificationResult(
+                passed=item.get("passed", False),
+                score=float(item.get("score", 0.0)),
+                issues=item.get("issues", []),
+                suggestions=item.get("suggestions", []),
+            ))
+
+        return results
@@ -8,7 +8,8 @@ The Worker role is responsible for:
 - Reporting results
 """
 
-from typing import Dict, Any, List, Optional
+from string import Template
+from typing import Dict, Any, List, Optional, Sequence
 import json
 
 from ..agents.base import IAgent, AgentResponse, AgentCapability
@@ -21,6 +22,30 @@ from .base import (
 )
 
 
+# Static lines lead the prompt so providers can reuse the cached prefix.
+# Optional sections are pre-rendered by _section and empty when unused.
+_IMPLEMENTATION_TEMPLATE = Template("""You are a WORKER implementing code.
+Implement the instruction carefully and completely.
+Create or modify files as needed.
+Report any issues encountered.
+
+INSTRUCTION:
+${prompt}${context}${files_to_modify}${files_to_create}${constraints}${expected_outcome}""")
+
+
+def _section(title: str, body: str) -> str:
+    """Render an optional prompt section, or nothing if body is empty."""
+    return f"\n\n{title}:\n{body}" if body else ""
+
+
+# Self-verification score indexed by number of issues found
+_SCORE_BY_ISSUE_COUNT = (1.0, 0.75, 0.5, 0.25, 0.0)
+
+# Instructions up to roughly 200 tokens (about 4 characters each) with
+# no constraints count as simple enough for the light agent
+_SIMPLE_INSTRUCTION_CHARS = 800
+
+
 class WorkerRole(IRoleStrategy):
     """
     Worker role implementation.
@@ -29,8 +54,16 @@ class WorkerRole(IRoleStrategy):
     Can be assigned to either Claude or Codex.
     """
 
-    def __init__(self, agent: IAgent):
+    def __init__(self, agent: IAgent, light_agent: Optional[IAgent] = None):
+        """
+        Initialize the Worker.
+
+        Args:
+            agent: Agent used for implementation
+            light_agent: Optional cheaper agent for simple instructions
+        """
         super().__init__(agent)
+        self.light_agent = light_agent
         self._last_instruction: Optional[Instruction] = None
         self._attempt_count: int = 0
 
@@ -42,7 +75,7 @@ class WorkerRole(IRoleStrategy):
         self,
         goal_description: str,
         current_state: Dict[str, Any],
-        history: List[Dict[str, Any]],
+        history: Sequence[Dict[str, Any]],
     ) -> Decision:
         """
         Worker typically doesn't decide, but can provide input.
@@ -81,8 +114,8 @@ class WorkerRole(IRoleStrategy):
         # Build implementation prompt
         prompt = self._build_implementation_prompt(instruction)
 
-        # Execute with the agent
-        response = self.agent.execute(prompt)
+        # Execute with the agent suited to the instruction
+        response = self._agent_for(instruction).execute(prompt)
 
         # Enrich response with instruction context
         response.metadata["instruction"] = instruction.prompt[:200]
@@ -112,14 +145,12 @@ class WorkerRole(IRoleStrategy):
 
         # Check if expected files were created
         if instruction.files_to_create:
-            missing = set(instruction.files_to_create) - set(response.files_created)
+            missing = instruction.files_to_create_set.difference(response.files_created)
             if missing:
-                issues.append(f"Expected files not created: {missing}")
+                issues.append(f"Expected files not created: {set(missing)}")
 
-        # Calculate score
-        score = 1.0
-        if issues:
-            score = max(0.0, 1.0 - (len(issues) * 0.25))
+        # Each issue costs a quarter of the score
+        score = _SCORE_BY_ISSUE_COUNT[min(len(issues), 4)]
 
         return VerificationResult(
             passed=len(issues) == 0 and response.success,
@@ -148,60 +179,36 @@ Issues to fix:
 
 Make the necessary corrections.""",
             context=original_instruction.context,
-            files_to_modify=original_instruction.files_to_modify + original_instruction.files_to_create,
+            files_to_modify=(
+                original_instruction.files_to_modify + original_instruction.files_to_create
+                if original_instruction.files_to_create
+                else original_instruction.files_to_modify
+            ),
             constraints=original_instruction.constraints,
             expected_outcome=original_instruction.expected_outcome,
             max_attempts=original_instruction.max_attempts - 1,
         )
 
+    def _agent_for(self, instruction: Instruction) -> IAgent:
+        """Route short, unconstrained instructions to the light agent."""
+        if (
+            self.light_agent is not None
+            and not instruction.constraints
+            and len(instruction.prompt) + len(instruction.context) <= _SIMPLE_INSTRUCTION_CHARS
+        ):
+            return self.light_agent
+        return self.agent
+
     def _build_implementation_prompt(self, instruction: Instruction) -> str:
         """Build the full implementation prompt."""
-        parts = [
-            "You are a WORKER implementing code.",
-            "",
-            "INSTRUCTION:",
-            instruction.prompt,
-        ]
-
-        if instruction.context:
-            parts.extend(["", "CONTEXT:", instruction.context])
-
-        if instruction.files_to_modify:
-            parts.extend([
-                "",
-                "FILES TO MODIFY:",
-                *[f"- {f}" for f in instruction.files_to_modify],
-            ])
-
-        if instruction.files_to_create:
-            parts.extend([
-                "",
-                "FILES TO CREATE:",
-                *[f"- {f}" for f in instruction.files_to_create],
-            ])
-
-        if instruction.constraints:
-            parts.extend([
-                "",
-                "CONSTRAINTS:",
-                *[f"- {c}" for c in instruction.constraints],
-            ])
-
-        if instruction.expected_outcome:
-            parts.extend([
-                "",
-                "EXPECTED OUTCOME:",
-                instruction.expected_outcome,
-            ])
-
-        parts.extend([
-            "",
-            "Implement the instruction carefully and completely.",
-            "Create or modify files as needed.",
-            "Report any issues encountered.",
-        ])
-
-        return "\n".join(parts)
+        return _IMPLEMENTATION_TEMPLATE.substitute(
+            prompt=instruction.prompt,
+            context=_section("CONTEXT", instruction.context),
+            files_to_modify=_section("FILES TO MODIFY", instruction.files_to_modify_block),
+            files_to_create=_section("FILES TO CREATE", instruction.files_to_create_block),
+            constraints=_section("CONSTRAINTS", instruction.constraints_block),
+            expected_outcome=_section("EXPECTED OUTCOME", instruction.expected_outcome),
+        )
 
     def execute_tests(self, test_command: str) -> AgentResponse:
         """
@@ -5,14 +5,81 @@ Various checkers for verifying implementation quality and correctness.
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Deque, Dict, Any, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+import json
 import subprocess
 import os
 import re
+import shutil
+import threading
 
+from .impact import TestImpactIndex
 
-@dataclass
+
+# Markdown code fences around JSON answers; a missing closing fence runs to the end
+_JSON_FENCE_RE = re.compile(r"```json(.*?)(?:```|\Z)", re.DOTALL)
+_FENCE_RE = re.compile(r"```(.*?)(?:```|\Z)", re.DOTALL)
+
+# Word tokens for keyword matching
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# pytest summary counts: "X passed, Y failed, Z skipped"
+_PYTEST_STATS_RE = re.compile(r"(\d+) (passed|failed|skipped)")
+
+# Debug output and TODO/FIXME markers, matched in one scan per line
+_QUALITY_MARKER_RE = re.compile(r"print\(|console\.log|TODO|FIXME")
+_DEBUG_MARKERS = frozenset({"print(", "console.log"})
+
+
+def _extension(file_path: str) -> str:
+    """Lowercased extension including the dot, "" if the name has none."""
+    _, dot, ext = file_path.rpartition(".")
+    if not dot or "/" in ext or os.sep in ext:
+        return ""
+    return "." + ext.lower()
+
+
+def _existing_paths(work_dir: str, files: List[str]) -> Set[str]:
+    """Joined paths of files that exist, listing each directory once."""
+    existing: Set[str] = set()
+    directories = {os.path.dirname(os.path.join(work_dir, f)) for f in files}
+    for directory in directories:
+        try:
+            with os.scandir(directory or ".") as entries:
+                prefix = directory and os.path.join(directory, "")
+                existing.update(prefix + entry.name for entry in entries)
+        except OSError:
+            continue
+    return existing
+
+
+@lru_cache(maxsize=None)
+def _tool_available(command: str) -> bool:
+    """Whether a syntax tool is on PATH, looked up once per process."""
+    return shutil.which(command) is not None
+
+
+@lru_cache(maxsize=32)
+def _goal_keywords(goal: str) -> FrozenSet[str]:
+    """Lowercased words longer than three characters, memoized per goal."""
+    return frozenset(
+        word.lower()
+        for word in _WORD_RE.findall(goal)
+        if len(word) > 3
+    )
+
+
+@lru_cache(maxsize=128)
+def _compile_criterion(criterion: str) -> "re.Pattern[str]":
+    """Compile a criterion into a case-insensitive literal pattern, memoized."""
+    return re.compile(re.escape(criterion), re.IGNORECASE)
+
+
+@dataclass(slots=True)
 class CheckResult:
     """Result of a single check"""
     name: str
@@ -21,8 +88,17 @@ class CheckResult:
     message: str = ""
     details: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "score": self.score,
+            "message": self.message,
+            "details": self.details,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class VerificationReport:
     """Complete verification report"""
     passed: bool
@@ -45,22 +121,16 @@ class VerificationReport:
             "passed_count": self.passed_count,
             "total_count": self.total_count,
             "summary": self.summary,
-            "checks": [
-                {
-                    "name": c.name,
-                    "passed": c.passed,
-                    "score": c.score,
-                    "message": c.message,
-                    "details": c.details,
-                }
-                for c in self.checks
-            ],
+            "checks": [c.to_dict() for c in self.checks],
         }
 
 
 class IChecker(ABC):
     """Abstract checker interface"""
 
+    # A failing blocking check skips the non-blocking checks after it
+    blocking: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -84,8 +154,11 @@ class IChecker(ABC):
 class SyntaxChecker(IChecker):
     """Checks code syntax validity"""
 
+    # Tests and quality checks are meaningless on unparseable code
+    blocking = True
+
+    # Python is compiled in-process, see _check_python_syntax
     SYNTAX_COMMANDS = {
-        ".py": ["python", "-m", "py_compile"],
         ".js": ["node", "--check"],
         ".ts": ["npx", "tsc", "--noEmit"],
         ".go": ["go", "build", "-n"],
@@ -94,6 +167,9 @@ class SyntaxChecker(IChecker):
         ".c": ["gcc", "-fsyntax-only"],
     }
 
+    # Tools that accept many files per run and name the failing file
+    BATCH_EXTENSIONS = frozenset({".ts", ".cpp", ".c"})
+
     @property
     def name(self) -> str:
         return "syntax"
@@ -116,11 +192,38 @@ class SyntaxChecker(IChecker):
                 message="No files to check",
             )
 
-        errors = []
+        # Missing files are found with one listing per directory rather
+        # than a stat per file; unknown file types are skipped
+        existing = _existing_paths(work_dir, files)
+        file_errors: Dict[str, str] = {}
+        batches: Dict[str, List[str]] = {}
+        groups: List[List[str]] = []
         for file_path in files:
-            error = self._check_file_syntax(file_path, work_dir)
-            if error:
-                errors.append(error)
+            ext = _extension(file_path)
+            if ext != ".py" and ext not in self.SYNTAX_COMMANDS:
+                continue
+            full_path = os.path.join(work_dir, file_path)
+            # Listings are case-sensitive, so confirm apparent misses with a stat
+            if full_path not in existing and not os.path.exists(full_path):
+                file_errors[file_path] = f"File not found: {file_path}"
+            elif ext in self.BATCH_EXTENSIONS:
+                # One subprocess per batchable extension, one per remaining file
+                batches.setdefault(ext, []).append(file_path)
+            else:
+                groups.append([file_path])
+        groups.extend(batches.values())
+
+        # Checks are subprocess-bound, so threads overlap them; capped at
+        # the core count to avoid spawning a compiler per file at once
+        if groups:
+            max_workers = min(len(groups), os.cpu_count() or 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for group_errors in executor.map(
+                    lambda group: self._check_group_syntax(group, work_dir),
+                    groups,
+                ):
+                    file_errors.update(group_errors)
+        errors = [file_errors[f] for f in files if f in file_errors]
 
         passed = len(errors) == 0
         score = 1.0 - (len(errors) / len(files)) if files else 1.0
@@ -133,18 +236,83 @@ class SyntaxChecker(IChecker):
             details={"errors": errors},
         )
 
+    def _check_group_syntax(self, group: List[str], work_dir: str) -> Dict[str, str]:
+        """
+        Check existing files sharing a syntax command with as few runs as possible.
+
+        Files named in a failed run's output are reported and dropped,
+        the rest are rerun, since some tools stop at the first error.
+
+        Returns:
+            Error message per failing file
+        """
+        if len(group) == 1:
+            error = self._run_file_syntax(group[0], work_dir)
+            return {group[0]: error} if error else {}
+
+        errors: Dict[str, str] = {}
+        pending = list(group)
+
+        cmd = self.SYNTAX_COMMANDS[_extension(group[0])]
+        if not _tool_available(cmd[0]):
+            return errors  # Tool not available, skip
+
+        while pending:
+            full_paths = [os.path.join(work_dir, f) for f in pending]
+            try:
+                result = subprocess.run(
+                    cmd + full_paths,
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+            except subprocess.TimeoutExpired:
+                errors.update((f, f"{f}: Syntax check timed out") for f in pending)
+                break
+            except FileNotFoundError:
+                break  # Tool not available, skip
+
+            if result.returncode == 0:
+                break
+
+            failed = [f for f, full_path in zip(pending, full_paths) if full_path in result.stderr]
+            if len(failed) == 1:
+                errors[failed[0]] = f"{failed[0]}: {result.stderr[:200]}"
+            else:
+                # Output names several files or none, attribute them one by one
+                for file_path in failed or pending:
+                    error = self._run_file_syntax(file_path, work_dir)
+                    if error:
+                        errors[file_path] = error
+                if not failed:
+                    break
+            pending = [f for f in pending if f not in failed]
+
+        return errors
+
     def _check_file_syntax(self, file_path: str, work_dir: str) -> Optional[str]:
         """Check single file syntax"""
-        ext = os.path.splitext(file_path)[1].lower()
-        cmd = self.SYNTAX_COMMANDS.get(ext)
-
-        if not cmd:
+        ext = _extension(file_path)
+        if ext != ".py" and ext not in self.SYNTAX_COMMANDS:
             return None  # Unknown file type, skip
 
-        full_path = os.path.join(work_dir, file_path)
-        if not os.path.exists(full_path):
+        if not os.path.exists(os.path.join(work_dir, file_path)):
             return f"File not found: {file_path}"
 
+        return self._run_file_syntax(file_path, work_dir)
+
+    def _run_file_syntax(self, file_path: str, work_dir: str) -> Optional[str]:
+        """Check syntax of a file known to exist"""
+        ext = _extension(file_path)
+        full_path = os.path.join(work_dir, file_path)
+
+        if ext == ".py":
+            return self._check_python_syntax(file_path, full_path)
+
+        cmd = self.SYNTAX_COMMANDS[ext]
+        if not _tool_available(cmd[0]):
+            return None  # Tool not available, skip
+
         try:
             result = subprocess.run(
                 cmd + [full_path],
@@ -161,6 +329,17 @@ class SyntaxChecker(IChecker):
 
         return None
 
+    def _check_python_syntax(self, file_path: str, full_path: str) -> Optional[str]:
+        """Compile a Python file in-process instead of spawning py_compile"""
+        try:
+            with open(full_path, "rb") as f:
+                compile(f.read(), file_path, "exec", dont_inherit=True)
+        except SyntaxError as e:
+            return f"{file_path}:{e.lineno}: {e.msg}"
+        except (OSError, ValueError) as e:
+            return f"{file_path}: {e}"
+        return None
+
 
 class TestChecker(IChecker):
     """Runs tests and checks results"""
@@ -173,6 +352,24 @@ class TestChecker(IChecker):
         "rust": ["cargo", "test"],
     }
 
+    __test__ = False  # Not a pytest test class despite the name
+
+    # Seconds before a test run is killed
+    TIMEOUT = 300
+
+    # Trailing output lines kept for the report
+    OUTPUT_TAIL_LINES = 200
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize checker.
+
+        Args:
+            cache_dir: Optional directory for the test impact index; when
+                set, Python runs are limited to tests the changed files affect
+        """
+        self.cache_dir = cache_dir
+
     @property
     def name(self) -> str:
         return "tests"
@@ -184,12 +381,17 @@ class TestChecker(IChecker):
         Context should contain:
             - work_dir: Working directory
             - language: Programming language
+            - languages: Optional list of languages whose suites run together
             - test_command: Optional custom test command
         """
         work_dir = context.get("work_dir", os.getcwd())
         language = context.get("language", "python")
+        languages = context.get("languages")
         custom_cmd = context.get("test_command")
 
+        if not custom_cmd and isinstance(languages, list) and len(languages) > 1:
+            return self._run_suites(languages, work_dir)
+
         cmd = custom_cmd.split() if custom_cmd else self.TEST_COMMANDS.get(language)
 
         if not cmd:
@@ -200,68 +402,157 @@ class TestChecker(IChecker):
                 message=f"No test command for {language}",
             )
 
+        if self.cache_dir and language == "python" and not custom_cmd and context.get("files"):
+            impacted = TestImpactIndex(work_dir, self.cache_dir).impacted_tests(context["files"])
+            if impacted:
+                cmd = cmd + impacted
+
+        return self._run_tests(cmd, work_dir)
+
+    def _run_suites(self, languages: List[str], work_dir: str) -> CheckResult:
+        """Run the test suites of several languages side by side and merge them"""
+        # Languages sharing a command (npm test) run it only once
+        commands: Dict[Tuple[str, ...], str] = {}
+        for language in languages:
+            cmd = self.TEST_COMMANDS.get(language)
+            if cmd:
+                commands.setdefault(tuple(cmd), language)
+
+        if not commands:
+            return CheckResult(
+                name=self.name,
+                passed=True,
+                score=0.5,
+                message=f"No test command for {', '.join(languages)}",
+            )
+
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            results = list(executor.map(
+                lambda cmd: self._run_tests(list(cmd), work_dir),
+                commands,
+            ))
+
+        stats = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
+        for result in results:
+            for key, count in result.details.get("stats", {}).items():
+                stats[key] += count
+
+        passed = all(r.passed for r in results)
+        if stats["total"] > 0:
+            score = stats["passed"] / stats["total"]
+        else:
+            score = 1.0 if passed else 0.0
+
+        return CheckResult(
+            name=self.name,
+            passed=passed,
+            score=score,
+            message=f"Tests: {stats['passed']}/{stats['total']} passed",
+            details={
+                "stats": stats,
+                "suites": {
+                    language: {
+                        "passed": result.passed,
+                        "message": result.message,
+                        "output": result.details.get("output", ""),
+                    }
+                    for language, result in zip(commands.values(), results)
+                },
+            },
+        )
+
+    def _run_tests(self, cmd: List[str], work_dir: str) -> CheckResult:
+        """Run one test command, streaming its output"""
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
                 cwd=work_dir,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=300,
+            )
+        except Exception as e:
+            return CheckResult(
+                name=self.name,
+                passed=False,
+                score=0.0,
+                message=f"Test execution failed: {e}",
             )
 
-            passed = result.returncode == 0
-            output = result.stdout + result.stderr
+        # Kill the run once the budget is spent, reading stops at EOF
+        timed_out = threading.Event()
 
-            # Try to parse test results
-            stats = self._parse_test_output(output)
+        def kill() -> None:
+            timed_out.set()
+            process.kill()
 
-            if stats["total"] > 0:
-                score = stats["passed"] / stats["total"]
-            else:
-                score = 1.0 if passed else 0.0
+        timer = threading.Timer(self.TIMEOUT, kill)
+        timer.start()
 
-            return CheckResult(
-                name=self.name,
-                passed=passed,
-                score=score,
-                message=f"Tests: {stats['passed']}/{stats['total']} passed",
-                details={
-                    "output": output[:2000],
-                    "stats": stats,
-                },
-            )
+        # Only the tail is kept, stats are parsed as lines stream in
+        tail: Deque[str] = deque(maxlen=self.OUTPUT_TAIL_LINES)
 
-        except subprocess.TimeoutExpired:
+        def lines() -> Iterator[str]:
+            for line in process.stdout:
+                tail.append(line)
+                yield line
+
+        try:
+            stats = self._parse_test_lines(lines())
+            returncode = process.wait()
+        except Exception as e:
+            process.kill()
             return CheckResult(
                 name=self.name,
                 passed=False,
                 score=0.0,
-                message="Tests timed out",
+                message=f"Test execution failed: {e}",
             )
-        except Exception as e:
+        finally:
+            timer.cancel()
+            process.stdout.close()
+
+        if timed_out.is_set():
             return CheckResult(
                 name=self.name,
                 passed=False,
                 score=0.0,
-                message=f"Test execution failed: {e}",
+                message="Tests timed out",
             )
 
+        passed = returncode == 0
+        output = "".join(tail)
+
+        if stats["total"] > 0:
+            score = stats["passed"] / stats["total"]
+        else:
+            score = 1.0 if passed else 0.0
+
+        return CheckResult(
+            name=self.name,
+            passed=passed,
+            score=score,
+            message=f"Tests: {stats['passed']}/{stats['total']} passed",
+            details={
+                "output": output[-2000:],
+                "stats": stats,
+            },
+        )
+
     def _parse_test_output(self, output: str) -> Dict[str, int]:
         """Parse test output for statistics"""
-        stats = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
-
-        # pytest format: "X passed, Y failed"
-        pytest_match = re.search(r"(\d+) passed", output)
-        if pytest_match:
-            stats["passed"] = int(pytest_match.group(1))
+        return self._parse_test_lines([output])
 
-        failed_match = re.search(r"(\d+) failed", output)
-        if failed_match:
-            stats["failed"] = int(failed_match.group(1))
+    def _parse_test_lines(self, lines: Iterable[str]) -> Dict[str, int]:
+        """Parse test output for statistics, chunk by chunk"""
+        stats = {"total": 0, "passed": 0, "failed": 0, "skipped": 0}
 
-        skipped_match = re.search(r"(\d+) skipped", output)
-        if skipped_match:
-            stats["skipped"] = int(skipped_match.group(1))
+        # pytest format: "X passed, Y failed", first count of each kind wins
+        counts: Dict[str, int] = {}
+        for line in lines:
+            for match in _PYTEST_STATS_RE.finditer(line):
+                counts.setdefault(match.group(2), int(match.group(1)))
+        stats.update(counts)
 
         stats["total"] = stats["passed"] + stats["failed"] + stats["skipped"]
 
@@ -351,14 +642,9 @@ Respond with JSON:
             )
 
         try:
-            import json
             output = response.output.strip()
-            if "```json" in output:
-                output = output.split("```json")[1].split("```")[0]
-            elif "```" in output:
-                output = output.split("```")[1].split("```")[0]
-
-            data = json.loads(output)
+            match = _JSON_FENCE_RE.search(output) or _FENCE_RE.search(output)
+            data = json.loads(match.group(1) if match else output)
 
             return CheckResult(
                 name=self.name,
@@ -385,37 +671,50 @@ Respond with JSON:
         criteria: List[str],
     ) -> CheckResult:
         """Simple keyword-based matching"""
-        # Extract keywords from goal
-        goal_words = set(
-            word.lower()
-            for word in re.findall(r"\b\w+\b", goal)
-            if len(word) > 3
-        )
+        # Goals repeat across verify/fix rounds, so their keywords are cached
+        goal_words = _goal_keywords(goal)
 
-        impl_words = set(
-            word.lower()
-            for word in re.findall(r"\b\w+\b", implementation)
-            if len(word) > 3
-        )
+        # Scan the implementation for goal keywords without collecting all
+        # of its words, stopping once every keyword has been seen
+        common = set()
+        if goal_words:
+            for match in _WORD_RE.finditer(implementation):
+                word = match.group(0)
+                if len(word) > 3:
+                    word = word.lower()
+                    if word in goal_words:
+                        common.add(word)
+                        if len(common) == len(goal_words):
+                            break
 
         # Calculate overlap
-        common = goal_words & impl_words
         if goal_words:
             score = len(common) / len(goal_words)
         else:
             score = 0.5
 
+        # Criteria quoted in the implementation are reported, not scored:
+        # output that merely repeats the criteria must not pass
+        matched_criteria = [
+            c for c in criteria if _compile_criterion(c).search(implementation)
+        ]
+
         return CheckResult(
             name=self.name,
             passed=score >= 0.5,
             score=min(1.0, score),
             message=f"Keyword match: {len(common)}/{len(goal_words)} keywords",
+            details={"matched": matched_criteria},
         )
 
 
 class QualityChecker(IChecker):
     """Checks code quality metrics"""
 
+    # Files larger than this are flagged by size and scanned only in part
+    MAX_SCAN_BYTES = 200_000
+    MAX_SCAN_LINES = 1000
+
     @property
     def name(self) -> str:
         return "quality"
@@ -461,25 +760,46 @@ class QualityChecker(IChecker):
             return [f"File not found: {file_path}"]
 
         try:
+            # Oversized files are reported by size and only their head is scanned
+            size = os.path.getsize(full_path)
+            too_large = size > self.MAX_SCAN_BYTES
+            if too_large:
+                issues.append(f"{file_path}: File too large ({size} bytes)")
+
+            line_count = 0
+            long_line = None
+            has_debug = False
+            has_todo = False
+
+            # Single streaming pass, each check stops once it has matched
             with open(full_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                lines = content.split("\n")
+                for line_count, line in enumerate(f, 1):
+                    if too_large and line_count > self.MAX_SCAN_LINES:
+                        break
+                    if long_line is None:
+                        length = len(line.rstrip("\n"))
+                        if length > 120:
+                            long_line = (line_count, length)
+                    if not (has_debug and has_todo):
+                        for match in _QUALITY_MARKER_RE.finditer(line):
+                            if match.group(0) in _DEBUG_MARKERS:
+                                has_debug = True
+                            else:
+                                has_todo = True
 
             # Check for common issues
-            if len(lines) > 500:
-                issues.append(f"{file_path}: File too long ({len(lines)} lines)")
+            if not too_large and line_count > 500:
+                issues.append(f"{file_path}: File too long ({line_count} lines)")
 
-            for i, line in enumerate(lines, 1):
-                if len(line) > 120:
-                    issues.append(f"{file_path}:{i}: Line too long ({len(line)} chars)")
-                    break  # Only report first occurrence
+            if long_line:
+                issues.append(f"{file_path}:{long_line[0]}: Line too long ({long_line[1]} chars)")
 
             # Check for debugging code
-            if "print(" in content or "console.log" in content:
+            if has_debug:
                 issues.append(f"{file_path}: Contains debug output")
 
             # Check for TODO/FIXME
-            if "TODO" in content or "FIXME" in content:
+            if has_todo:
                 issues.append(f"{file_path}: Contains TODO/FIXME comments")
 
         except Exception as e:
@@ -523,19 +843,23 @@ class VerificationChecker:
         Returns:
             VerificationReport
         """
-        results = []
+        # Blocking checks run first, the rest only if they all passed
+        blocking = [i for i, c in enumerate(self.checkers) if c.blocking]
+        rest = [i for i, c in enumerate(self.checkers) if not c.blocking]
 
-        for checker in self.checkers:
-            try:
-                result = checker.check(context)
-                results.append(result)
-            except Exception as e:
-                results.append(CheckResult(
-                    name=checker.name,
-                    passed=False,
-                    score=0.0,
-                    message=f"Check failed: {e}",
-                ))
+        results_by_index = dict(zip(blocking, self._run_checkers(blocking, context)))
+        if all(r.passed for r in results_by_index.values()):
+            results_by_index.update(zip(rest, self._run_checkers(rest, context)))
+
+        results = [
+            results_by_index.get(i) or CheckResult(
+                name=checker.name,
+                passed=False,
+                score=0.0,
+                message="Skipped: prior blocking check failed",
+            )
+            for i, checker in enumerate(self.checkers)
+        ]
 
         # Calculate overall
         if results:
@@ -558,6 +882,31 @@ class VerificationChecker:
             summary=" | ".join(summary_parts),
         )
 
+    def _run_checkers(self, indices: List[int], context: Dict[str, Any]) -> List[CheckResult]:
+        """Run the checkers at indices side by side, results in the same order"""
+        if not indices:
+            return []
+
+        # Checkers are independent and mostly wait on subprocesses, files
+        # or an agent, so threads overlap them
+        with ThreadPoolExecutor(max_workers=len(indices)) as executor:
+            return list(executor.map(
+                lambda i: self._run_checker(self.checkers[i], context),
+                indices,
+            ))
+
+    def _run_checker(self, checker: IChecker, context: Dict[str, Any]) -> CheckResult:
+        """Run one checker, turning an exception into a failed result"""
+        try:
+            return checker.check(context)
+        except Exception as e:
+            return CheckResult(
+                name=checker.name,
+                passed=False,
+                score=0.0,
+                message=f"Check failed: {e}",
+            )
+
     def add_checker(self, checker: IChecker) -> None:
         """Add a checker"""
         self.checkers.append(checker)
@@ -0,0 +1,159 @@
+"""
+Test Impact Index
+
+Maps changed source files to the test files that import them, directly
+or through other project modules, so a re-verification only has to run
+the tests a change can affect.
+"""
+
+import ast
+import json
+import os
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+# Directories that never hold project sources
+_SKIP_DIRS = frozenset({"node_modules", "venv", "__pycache__", "build", "dist"})
+
+
+def _is_test_file(path: str) -> bool:
+    """Whether a path follows pytest's test file naming."""
+    name = os.path.basename(path)
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
+
+
+def _module_name(path: str) -> str:
+    """Last dotted component a file is imported by, e.g. "checker" or "verification"."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.basename(os.path.dirname(path)) if stem == "__init__" else stem
+
+
+def _imported_names(source: str) -> Set[str]:
+    """Every name component a module imports, e.g. {"pkg", "mod", "func"}."""
+    names: Set[str] = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                names.update(alias.name.split("."))
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                names.update(node.module.split("."))
+            names.update(alias.name for alias in node.names)
+    return names
+
+
+class TestImpactIndex:
+    """
+    Import index of the Python files under a project root.
+
+    Each file's imports are parsed once and kept on disk keyed by mtime,
+    so later lookups only re-parse files that changed. Modules are
+    matched by name, which can over-select tests but doesn't miss a
+    static importer, direct or transitive.
+    """
+
+    __test__ = False  # Not a pytest test class despite the name
+
+    def __init__(self, root: str, cache_dir: str):
+        """
+        Initialize index.
+
+        Args:
+            root: Project root to scan
+            cache_dir: Directory the index is persisted in
+        """
+        self.root = root
+        self.cache_path = os.path.join(cache_dir, "test_impact.json")
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def impacted_tests(self, changed_files: Iterable[str]) -> Optional[List[str]]:
+        """
+        Find the test files affected by a set of changed files.
+
+        Args:
+            changed_files: Changed paths, relative to the root
+
+        Returns:
+            Sorted relative test paths, or None if the full suite should run
+        """
+        changed = list(changed_files)
+        # Data files and conftest.py reach tests without an import
+        if not changed or any(
+            not f.endswith(".py") or os.path.basename(f) == "conftest.py" for f in changed
+        ):
+            return None
+
+        self.refresh()
+
+        # Reverse import closure over module names
+        affected = {_module_name(f) for f in changed}
+        selected = {f for f in changed if _is_test_file(f)}
+        remaining = dict(self._entries)
+        grew = True
+        while grew:
+            grew = False
+            for path, entry in list(remaining.items()):
+                if affected.intersection(entry["imports"]):
+                    # Fixtures reach tests without an import, so a
+                    # conftest.py in the closure can affect any test
+                    if os.path.basename(path) == "conftest.py":
+                        return None
+                    del remaining[path]
+                    affected.add(_module_name(path))
+                    if _is_test_file(path):
+                        selected.add(path)
+                    grew = True
+
+        return sorted(selected) or None
+
+    def refresh(self) -> None:
+        """Re-parse files whose mtime changed and persist the index."""
+        entries: Dict[str, Dict[str, Any]] = {}
+        for path, mtime in self._scan():
+            entry = self._entries.get(path)
+            if entry is None or entry["mtime"] != mtime:
+                try:
+                    with open(os.path.join(self.root, path), "r", encoding="utf-8") as f:
+                        imports = sorted(_imported_names(f.read()))
+                except (OSError, SyntaxError, ValueError):
+                    imports = []
+                entry = {"mtime": mtime, "imports": imports}
+            entries[path] = entry
+
+        if entries != self._entries:
+            self._entries = entries
+            self._save()
+
+    def _scan(self) -> Iterator[Tuple[str, int]]:
+        """Yield (relative path, mtime) for every Python file under the root."""
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [
+                d for d in dirnames
+                if not d.startswith(".") and d not in _SKIP_DIRS
+            ]
+            for filename in filenames:
+                if filename.endswith(".py"):
+                    full_path = os.path.join(dirpath, filename)
+                    try:
+                        mtime = os.stat(full_path).st_mtime_ns
+                    except OSError:
+                        continue
+                    yield os.path.relpath(full_path, self.root), mtime
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the persisted index, empty if missing or unreadable."""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self) -> None:
+        """Persist the index next to other session data."""
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+        except OSError:
+            pass  # The index is an optimization, running without it is fine
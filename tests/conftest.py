@@ -3,25 +3,98 @@ Pytest configuration and shared fixtures
 """
 
 import pytest
+import itertools
 import os
-import tempfile
+import shutil
+import uuid
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock
 from datetime import datetime
 
-# Add src to path
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from agents.base import IAgent, AgentType, AgentCapability, AgentResponse, AgentConfig
+from agents.base import IAgent, AgentType, AgentCapability, AgentResponse, AgentConfig, _which
+from agents.claude_agent import ClaudeAgent
+from agents.codex_agent import CodexAgent
 from roles.base import Decision, DecisionType, VerificationResult, Instruction
 from goal.parser import Goal, AcceptanceCriterion, CriterionStatus
+from protocol import messages as protocol_messages
 from protocol.messages import RequestMessage, ResponseMessage, MessageType
 
 
+class FakeRunner:
+    """
+    Stand-in for subprocess.run, injected into agents as their runner.
+
+    Results are plain namespaces rather than Mocks, since callers only
+    read returncode, stdout and stderr.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget recorded calls and return an empty successful result"""
+        self.result = SimpleNamespace(returncode=0, stdout="", stderr="")
+        self.exc = None
+        self.calls = []
+
+    def set_result(self, stdout="", returncode=0, stderr="", exc=None):
+        """Set what the next calls return, or the exception they raise"""
+        self.result = SimpleNamespace(returncode=returncode, stdout=stdout, stderr=stderr)
+        self.exc = exc
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.exc is not None:
+            raise self.exc
+        return self.result
+
+    @property
+    def called(self):
+        return bool(self.calls)
+
+    @property
+    def call_args(self):
+        return self.calls[-1] if self.calls else None
+
+
+@pytest.fixture(scope="module")
+def _module_runner():
+    """FakeRunner shared by the module-scoped agents"""
+    return FakeRunner()
+
+
 @pytest.fixture
-def mock_agent():
-    """Create a mock agent for testing"""
+def fake_runner(_module_runner):
+    """The shared FakeRunner, reset for the test"""
+    _module_runner.reset()
+    return _module_runner
+
+
+@pytest.fixture
+def fresh_which():
+    """Empty the agents' cached PATH lookups around the test"""
+    _which.cache_clear()
+    yield
+    _which.cache_clear()
+
+
+# Agents only hold their config, capabilities and runner, so one default
+# instance per module is safe to share between tests
+@pytest.fixture(scope="module")
+def claude_agent(_module_runner):
+    """Default-configured ClaudeAgent running commands through the FakeRunner"""
+    return ClaudeAgent(runner=_module_runner)
+
+
+@pytest.fixture(scope="module")
+def codex_agent(_module_runner):
+    """Default-configured CodexAgent running commands through the FakeRunner"""
+    return CodexAgent(runner=_module_runner)
+
+
+def _make_mock_agent():
+    """Build a mock agent with a successful default execute response"""
     agent = Mock(spec=IAgent)
     agent.agent_type = AgentType.CLAUDE
     agent.capabilities = [AgentCapability.CODE_GENERATION, AgentCapability.CODE_ANALYSIS]
@@ -40,28 +113,36 @@ def mock_agent():
 
 
 @pytest.fixture
-def mock_claude_agent(mock_agent):
-    """Claude-specific mock agent"""
-    mock_agent.agent_type = AgentType.CLAUDE
-    mock_agent.capabilities = [
+def mock_agent():
+    """Create a mock agent for testing"""
+    return _make_mock_agent()
+
+
+@pytest.fixture
+def mock_claude_agent():
+    """Claude-specific mock agent, distinct from mock_codex_agent"""
+    agent = _make_mock_agent()
+    agent.agent_type = AgentType.CLAUDE
+    agent.capabilities = [
         AgentCapability.CODE_ANALYSIS,
         AgentCapability.CODE_REVIEW,
         AgentCapability.PLANNING,
         AgentCapability.VERIFICATION,
     ]
-    return mock_agent
+    return agent
 
 
 @pytest.fixture
-def mock_codex_agent(mock_agent):
-    """Codex-specific mock agent"""
-    mock_agent.agent_type = AgentType.CODEX
-    mock_agent.capabilities = [
+def mock_codex_agent():
+    """Codex-specific mock agent, distinct from mock_claude_agent"""
+    agent = _make_mock_agent()
+    agent.agent_type = AgentType.CODEX
+    agent.capabilities = [
         AgentCapability.CODE_GENERATION,
         AgentCapability.FILE_OPERATIONS,
         AgentCapability.TEST_EXECUTION,
     ]
-    return mock_agent
+    return agent
 
 
 @pytest.fixture
@@ -196,17 +277,51 @@ def sample_response_message():
     )
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+_FIXED_DT = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def _deterministic_messages(monkeypatch):
+    """Counter-based message ids and a fixed clock, no uuid4 or clock reads"""
+    counter = itertools.count(1)
+    monkeypatch.setattr(protocol_messages, "_id_generator", lambda: f"{next(counter):08x}")
+    monkeypatch.setattr(protocol_messages, "_now", lambda: _FIXED_DT)
+
+
+@pytest.fixture(scope="session")
+def shm_root(tmp_path_factory):
+    """RAM-backed root for per-test directories, one per xdist worker process"""
+    shm = Path("/dev/shm")
+    if not shm.is_dir():
+        # No tmpfs on this platform, fall back to pytest's temp directory
+        yield tmp_path_factory.mktemp("ai-orch")
+        return
+    # xdist names its workers gw0, gw1, ...; the pid separates concurrent runs
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    root = shm / f"ai-orch-{worker}-{os.getpid()}"
+    root.mkdir()
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
 
 
 @pytest.fixture
-def temp_goal_file(temp_dir):
-    """Create a temporary goal file"""
-    goal_content = """# Test Goal
+def temp_dir(shm_root):
+    """Create a temporary directory for tests, in memory where available"""
+    path = shm_root / uuid.uuid4().hex
+    path.mkdir()
+    return str(path)
+
+
+@pytest.fixture(scope="class")
+def shared_temp_dir(tmp_path_factory):
+    """Temporary directory shared by a test class, for tests using distinct filenames"""
+    return str(tmp_path_factory.mktemp("shared"))
+
+
+@pytest.fixture(scope="session")
+def simple_goal_text():
+    """Markdown of a small goal with every section"""
+    return """# Test Goal
 
 ## Description
 A test goal for testing.
@@ -223,22 +338,28 @@ A test goal for testing.
 ## Constraints
 - Use Python
 """
-    goal_path = Path(temp_dir) / "GOAL.txt"
-    goal_path.write_text(goal_content)
+
+
+# Goal files are only read, so each is written once per session
+@pytest.fixture(scope="session")
+def temp_goal_file(tmp_path_factory, simple_goal_text):
+    """Create a temporary goal file"""
+    goal_path = tmp_path_factory.mktemp("goal") / "GOAL.txt"
+    goal_path.write_text(simple_goal_text)
     return str(goal_path)
 
 
-@pytest.fixture
-def empty_goal_file(temp_dir):
+@pytest.fixture(scope="session")
+def empty_goal_file(tmp_path_factory):
     """Create an empty goal file"""
-    goal_path = Path(temp_dir) / "EMPTY_GOAL.txt"
+    goal_path = tmp_path_factory.mktemp("goal") / "EMPTY_GOAL.txt"
     goal_path.write_text("")
     return str(goal_path)
 
 
-@pytest.fixture
-def invalid_goal_file(temp_dir):
+@pytest.fixture(scope="session")
+def invalid_goal_file(tmp_path_factory):
     """Create an invalid goal file"""
-    goal_path = Path(temp_dir) / "INVALID_GOAL.txt"
+    goal_path = tmp_path_factory.mktemp("goal") / "INVALID_GOAL.txt"
     goal_path.write_text("This is not a valid goal format\nNo structure here")
     return str(goal_path)
@@ -3,24 +3,20 @@ Tests for Agent implementations
 
 Tests:
 1. test_claude_agent_execute_success
-2. test_claude_agent_execute_timeout
-3. test_claude_agent_analyze_codebase
-4. test_codex_agent_execute_success
-5. test_codex_agent_execute_timeout
-6. test_codex_agent_json_output
-7. test_agent_capability_detection
-8. test_agent_error_handling
-9. test_agent_retry_logic
-10. test_agent_output_parsing
+2. test_claude_agent_analyze_codebase
+3. test_codex_agent_execute_success
+4. test_codex_agent_json_output
+5. test_agent_capability_detection
+6. test_agent_execute_timeout
+7. test_agent_error_handling
+8. test_agent_retry_logic
+9. test_agent_output_parsing
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 import subprocess
-
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import shutil
+import threading
 
 from agents.base import IAgent, AgentType, AgentCapability, AgentResponse, AgentConfig
 from agents.claude_agent import ClaudeAgent
@@ -28,190 +24,222 @@ from agents.codex_agent import CodexAgent
 from agents.factory import AgentFactory
 
 
-class TestClaudeAgent:
-    """Tests for ClaudeAgent"""
+def _icontains(haystack, needle, cap=4096):
+    """Case-insensitive containment over the first cap characters only"""
+    return needle.lower() in haystack[:cap].lower()
 
-    def test_claude_agent_execute_success(self):
-        """Test successful execution with Claude agent"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout='{"result": "Success", "files_created": ["test.py"]}',
-                stderr="",
-            )
 
-            agent = ClaudeAgent()
-            response = agent.execute("Create a test file")
+class _FakeProcess:
+    """Stand-in for a streaming CLI process, optionally hanging until killed"""
+
+    def __init__(self, lines, returncode=0, hang=False):
+        self.killed = threading.Event()
+        self.returncode = None
+        self._exit_code = returncode
+        self.stdout = self._read(lines, hang)
+
+    def _read(self, lines, hang):
+        yield from lines
+        if hang:
+            self.killed.wait(5)
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        self.returncode = -9 if self.killed.is_set() else self._exit_code
+        return self.returncode
+
+    def kill(self):
+        self.killed.set()
+
 
-            assert response.success
-            assert mock_run.called
+class TestClaudeAgent:
+    """Tests for ClaudeAgent"""
 
-    def test_claude_agent_execute_timeout(self):
-        """Test timeout handling in Claude agent"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired(cmd="claude", timeout=120)
+    def test_claude_agent_execute_success(self, fake_runner, claude_agent):
+        """Test successful execution with Claude agent"""
+        fake_runner.set_result(
+            returncode=0,
+            stdout='{"result": "Success", "files_created": ["test.py"]}',
+            stderr="",
+        )
 
-            agent = ClaudeAgent(AgentConfig(command="claude", timeout=120))
-            response = agent.execute("Long running task")
+        response = claude_agent.execute("Create a test file")
 
-            assert not response.success
-            assert "timed out" in response.error.lower()
-            assert response.exit_code == -1
+        assert response.success
+        assert fake_runner.called
 
-    def test_claude_agent_analyze_codebase(self):
+    def test_claude_agent_analyze_codebase(self, fake_runner, claude_agent):
         """Test Claude agent's analysis capability"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="The code implements a REST API with three endpoints.",
-                stderr="",
-            )
+        fake_runner.set_result(
+            returncode=0,
+            stdout="The code implements a REST API with three endpoints.",
+            stderr="",
+        )
 
-            agent = ClaudeAgent()
-            result = agent.analyze("def hello(): pass", "What does this code do?")
+        result = claude_agent.analyze("def hello(): pass", "What does this code do?")
 
-            assert "implements" in result.lower() or "code" in result.lower() or mock_run.called
+        assert _icontains(result, "implements") or _icontains(result, "code") or fake_runner.called
 
-    def test_claude_agent_verify_success(self):
+    def test_claude_agent_verify_success(self, fake_runner, claude_agent):
         """Test Claude agent verification - pass case"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="PASS - The implementation matches expectations",
-                stderr="",
-            )
+        fake_runner.set_result(
+            returncode=0,
+            stdout="PASS - The implementation matches expectations",
+            stderr="",
+        )
 
-            agent = ClaudeAgent()
-            result = agent.verify("Create hello function", "def hello(): print('hello')")
+        result = claude_agent.verify("Create hello function", "def hello(): print('hello')")
 
-            assert result is True
+        assert result is True
 
-    def test_claude_agent_verify_failure(self):
+    def test_claude_agent_verify_failure(self, fake_runner, claude_agent):
         """Test Claude agent verification - fail case"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="FAIL - Missing error handling",
-                stderr="",
-            )
+        fake_runner.set_result(
+            returncode=0,
+            stdout="FAIL - Missing error handling",
+            stderr="",
+        )
 
-            agent = ClaudeAgent()
-            result = agent.verify("Create robust function", "def func(): pass")
+        result = claude_agent.verify("Create robust function", "def func(): pass")
 
-            assert result is False
+        assert result is False
 
+    def test_claude_agent_stream_close_kills_process(self):
+        """Test closing the stream early kills the CLI process"""
+        process = _FakeProcess(["first\n", "second\n"], hang=True)
+        agent = ClaudeAgent(popen=lambda *args, **kwargs: process)
 
-class TestCodexAgent:
-    """Tests for CodexAgent"""
+        stream = agent.execute_stream("Decide")
+        assert next(stream) == "first\n"
+        stream.close()
 
-    def test_codex_agent_execute_success(self):
-        """Test successful execution with Codex agent"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout='{"output": "File created", "files_created": ["app.py"]}',
-                stderr="",
-            )
+        assert process.killed.is_set()
 
-            agent = CodexAgent()
-            response = agent.execute("Create app.py with Flask setup")
+    def test_claude_agent_stream_timeout(self):
+        """Test a CLI that stops producing output is killed after the timeout"""
+        process = _FakeProcess(["partial\n"], hang=True)
+        config = AgentConfig(command="claude", timeout=0.1)
+        agent = ClaudeAgent(config, popen=lambda *args, **kwargs: process)
 
-            assert response.success
-            assert mock_run.called
+        with pytest.raises(RuntimeError, match="timed out"):
+            list(agent.execute_stream("Decide"))
 
-    def test_codex_agent_execute_timeout(self):
-        """Test timeout handling in Codex agent"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired(cmd="codex", timeout=300)
+        assert process.killed.is_set()
 
-            agent = CodexAgent(AgentConfig(command="codex", timeout=300))
-            response = agent.execute("Complex task")
 
-            assert not response.success
-            assert "timed out" in response.error.lower()
+class TestCodexAgent:
+    """Tests for CodexAgent"""
+
+    def test_codex_agent_execute_success(self, fake_runner, codex_agent):
+        """Test successful execution with Codex agent"""
+        fake_runner.set_result(
+            returncode=0,
+            stdout='{"output": "File created", "files_created": ["app.py"]}',
+            stderr="",
+        )
 
-    def test_codex_agent_json_output(self):
+        response = codex_agent.execute("Create app.py with Flask setup")
+
+        assert response.success
+        assert fake_runner.called
+
+    def test_codex_agent_json_output(self, fake_runner, codex_agent):
         """Test Codex agent JSON output parsing"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout='{"output": "Done", "files_created": ["a.py", "b.py"], "model": "gpt-4"}',
-                stderr="",
-            )
+        fake_runner.set_result(
+            returncode=0,
+            stdout='{"output": "Done", "files_created": ["a.py", "b.py"], "model": "gpt-4"}',
+            stderr="",
+        )
 
-            agent = CodexAgent()
-            response = agent.execute("Create files")
+        response = codex_agent.execute("Create files")
 
-            assert response.success
-            # JSON should be parsed
-            assert response.output == "Done" or "Done" in response.output
+        assert response.success
+        # JSON should be parsed
+        assert response.output == "Done" or "Done" in response.output
 
-    def test_codex_agent_stdin_execution(self):
+    def test_codex_agent_stdin_execution(self, fake_runner, codex_agent):
         """Test Codex agent with stdin piping"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="Processed from stdin",
-                stderr="",
-            )
+        fake_runner.set_result(
+            returncode=0,
+            stdout="Processed from stdin",
+            stderr="",
+        )
 
-            agent = CodexAgent()
-            response = agent.execute_with_stdin("Long prompt from stdin")
+        response = codex_agent.execute_with_stdin("Long prompt from stdin")
 
-            assert response.success
-            # Check stdin was used
-            call_kwargs = mock_run.call_args
-            assert call_kwargs is not None
+        assert response.success
+        # Check stdin was used
+        call_args, call_kwargs = fake_runner.call_args
+        assert call_kwargs["input"] == "Long prompt from stdin"
 
 
 class TestAgentCapabilities:
     """Tests for agent capability detection"""
 
-    def test_agent_capability_detection(self):
+    def test_agent_capability_detection(self, claude_agent, codex_agent):
         """Test that agents report correct capabilities"""
-        claude = ClaudeAgent()
-        codex = CodexAgent()
-
         # Claude should have analysis capabilities
-        assert AgentCapability.CODE_ANALYSIS in claude.capabilities
-        assert AgentCapability.PLANNING in claude.capabilities
+        assert AgentCapability.CODE_ANALYSIS in claude_agent.capabilities
+        assert AgentCapability.PLANNING in claude_agent.capabilities
 
         # Codex should have generation capabilities
-        assert AgentCapability.CODE_GENERATION in codex.capabilities
-        assert AgentCapability.FILE_OPERATIONS in codex.capabilities
+        assert AgentCapability.CODE_GENERATION in codex_agent.capabilities
+        assert AgentCapability.FILE_OPERATIONS in codex_agent.capabilities
 
-    def test_agent_has_capability(self):
+    def test_agent_has_capability(self, claude_agent):
         """Test has_capability method"""
-        agent = ClaudeAgent()
+        assert claude_agent.has_capability(AgentCapability.CODE_ANALYSIS)
+        assert not claude_agent.has_capability(AgentCapability.TEST_EXECUTION)
 
-        assert agent.has_capability(AgentCapability.CODE_ANALYSIS)
-        assert not agent.has_capability(AgentCapability.TEST_EXECUTION)
+    def test_agent_availability_cached(self, monkeypatch, fresh_which):
+        """Test the CLI is looked up on PATH only once"""
+        lookups = []
+        monkeypatch.setattr(shutil, "which", lambda command: lookups.append(command) or "/usr/bin/claude")
+
+        assert ClaudeAgent().is_available()
+        assert ClaudeAgent().is_available()
+
+        assert lookups == ["claude"]
 
 
 class TestAgentErrorHandling:
     """Tests for agent error handling"""
 
-    def test_agent_error_handling_file_not_found(self):
+    @pytest.mark.parametrize(
+        "agent_cls,cmd,timeout",
+        [(ClaudeAgent, "claude", 120), (CodexAgent, "codex", 300)],
+        ids=["claude", "codex"],
+    )
+    def test_agent_execute_timeout(self, fake_runner, agent_cls, cmd, timeout):
+        """Test timeout handling in both agents"""
+        fake_runner.set_result(exc=subprocess.TimeoutExpired(cmd=cmd, timeout=timeout))
+
+        agent = agent_cls(AgentConfig(command=cmd, timeout=timeout), runner=fake_runner)
+        response = agent.execute("Long running task")
+
+        assert not response.success
+        assert _icontains(response.error, "timed out")
+        assert response.exit_code == -1
+
+    def test_agent_error_handling_file_not_found(self, fake_runner, claude_agent):
         """Test handling when CLI not found"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError("claude not found")
+        fake_runner.set_result(exc=FileNotFoundError("claude not found"))
 
-            agent = ClaudeAgent()
-            response = agent.execute("Test")
+        response = claude_agent.execute("Test")
 
-            assert not response.success
-            assert response.exit_code == -2
+        assert not response.success
+        assert response.exit_code == -2
 
-    def test_agent_error_handling_generic(self):
+    def test_agent_error_handling_generic(self, fake_runner, claude_agent):
         """Test handling generic exceptions"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = Exception("Unexpected error")
+        fake_runner.set_result(exc=Exception("Unexpected error"))
 
-            agent = ClaudeAgent()
-            response = agent.execute("Test")
+        response = claude_agent.execute("Test")
 
-            assert not response.success
-            assert response.exit_code == -3
+        assert not response.success
+        assert response.exit_code == -3
 
     def test_agent_error_response_factory(self):
         """Test AgentResponse.error_response factory"""
@@ -244,50 +272,51 @@ class TestAgentRetryLogic:
 class TestAgentOutputParsing:
     """Tests for agent output parsing"""
 
-    def test_agent_output_parsing_json(self):
-        """Test parsing JSON output"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout='{"result": "parsed", "files_modified": ["x.py"]}',
-                stderr="",
-            )
+    @pytest.mark.parametrize(
+        "agent_fixture,stdout,expected",
+        [
+            ("claude_agent", '{"result": "parsed", "files_modified": ["x.py"]}', None),
+            ("claude_agent", "Plain text response without JSON", "Plain text"),
+            ("codex_agent", "Plain text response without JSON", "Plain text"),
+        ],
+        ids=["claude_json", "claude_plain_text", "codex_plain_text"],
+    )
+    def test_agent_output_parsing(self, request, fake_runner, agent_fixture, stdout, expected):
+        """Test parsing JSON and plain text output"""
+        fake_runner.set_result(returncode=0, stdout=stdout, stderr="")
+
+        agent = request.getfixturevalue(agent_fixture)
+        response = agent.execute("Test")
 
-            agent = ClaudeAgent()
-            response = agent.execute("Test")
+        assert response.success
+        if expected is not None:
+            assert expected in response.output
 
-            assert response.success
 
-    def test_agent_output_parsing_plain_text(self):
-        """Test parsing plain text output"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="Plain text response without JSON",
-                stderr="",
-            )
+@pytest.fixture(scope="module")
+def factory_claude():
+    """Default Claude agent from the factory, created once per module"""
+    return AgentFactory.create(AgentType.CLAUDE)
 
-            agent = ClaudeAgent()
-            response = agent.execute("Test")
 
-            assert response.success
-            assert "Plain text" in response.output
+@pytest.fixture(scope="module")
+def factory_codex():
+    """Default Codex agent from the factory, created once per module"""
+    return AgentFactory.create(AgentType.CODEX)
 
 
 class TestAgentFactory:
     """Tests for AgentFactory"""
 
-    def test_factory_create_claude(self):
+    def test_factory_create_claude(self, factory_claude):
         """Test creating Claude agent via factory"""
-        agent = AgentFactory.create(AgentType.CLAUDE)
-        assert isinstance(agent, ClaudeAgent)
-        assert agent.agent_type == AgentType.CLAUDE
+        assert isinstance(factory_claude, ClaudeAgent)
+        assert factory_claude.agent_type == AgentType.CLAUDE
 
-    def test_factory_create_codex(self):
+    def test_factory_create_codex(self, factory_codex):
         """Test creating Codex agent via factory"""
-        agent = AgentFactory.create(AgentType.CODEX)
-        assert isinstance(agent, CodexAgent)
-        assert agent.agent_type == AgentType.CODEX
+        assert isinstance(factory_codex, CodexAgent)
+        assert factory_codex.agent_type == AgentType.CODEX
 
     def test_factory_create_with_config(self):
         """Test creating agent with custom config"""
@@ -10,27 +10,45 @@ Tests:
 6. test_max_iterations_reached
 7. test_work_dir_not_exists
 8. test_work_dir_no_permissions
-9. test_large_output_handling
+9. test_claude_execute_output
 10. test_unicode_in_goal_and_output
 """
 
 import pytest
-from unittest.mock import Mock, patch
+import shutil
 import tempfile
-import os
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from orchestrator import Orchestrator, OrchestratorConfig, OrchestratorState
-from agents.base import AgentType, AgentResponse
+from agents.base import AgentType, AgentResponse, AgentConfig
 from agents.claude_agent import ClaudeAgent
 from agents.codex_agent import CodexAgent
 from roles.base import Decision, DecisionType, VerificationResult, Instruction
 from goal.parser import GoalParser, Goal, AcceptanceCriterion
 
 
+# Goal files whose parsing the edge-case tests inspect, by name
+_GOAL_TEXTS = {
+    "invalid": "Random text without proper markdown structure",
+    "title_only": "# Just A Title\n\nSome text but no criteria",
+    "malformed": """# Test
+
+## Acceptance Criteria
+- Not a checkbox item
+-[] Missing space
+- [x Missing bracket
+- [ ] Valid one
+""",
+}
+
+
+@pytest.fixture(scope="module")
+def parsed_goals():
+    """Each of _GOAL_TEXTS parsed once per module, without touching disk"""
+    parser = GoalParser()
+    return {name: parser.parse_content(text) for name, text in _GOAL_TEXTS.items()}
+
+
 class TestGoalEdgeCases:
     """Edge cases for goal parsing"""
 
@@ -41,43 +59,24 @@ class TestGoalEdgeCases:
         with pytest.raises(ValueError, match="empty"):
             parser.parse_file(empty_goal_file)
 
-    def test_invalid_goal_format(self, temp_dir):
+    def test_invalid_goal_format(self, parsed_goals):
         """Test handling invalid goal format"""
-        invalid_path = Path(temp_dir) / "invalid.txt"
-        invalid_path.write_text("Random text without proper markdown structure")
-
-        parser = GoalParser()
-        goal = parser.parse_file(str(invalid_path))
+        goal = parsed_goals["invalid"]
 
         # Should parse but with defaults
         assert goal.title == "Untitled Goal" or goal.title  # Has some title
         assert len(goal.acceptance_criteria) == 0  # No valid criteria
 
-    def test_goal_with_only_title(self, temp_dir):
+    def test_goal_with_only_title(self, parsed_goals):
         """Test goal with only title"""
-        goal_path = Path(temp_dir) / "title_only.txt"
-        goal_path.write_text("# Just A Title\n\nSome text but no criteria")
-
-        parser = GoalParser()
-        goal = parser.parse_file(str(goal_path))
+        goal = parsed_goals["title_only"]
 
         assert goal.title == "Just A Title"
         assert goal.total_criteria == 0
 
-    def test_goal_with_malformed_criteria(self, temp_dir):
+    def test_goal_with_malformed_criteria(self, parsed_goals):
         """Test goal with malformed acceptance criteria"""
-        goal_path = Path(temp_dir) / "malformed.txt"
-        goal_path.write_text("""# Test
-
-## Acceptance Criteria
-- Not a checkbox item
--[] Missing space
-- [x Missing bracket
-- [ ] Valid one
-""")
-
-        parser = GoalParser()
-        goal = parser.parse_file(str(goal_path))
+        goal = parsed_goals["malformed"]
 
         # Should only parse the valid one
         assert len(goal.acceptance_criteria) >= 1
@@ -86,52 +85,67 @@ class TestGoalEdgeCases:
 class TestAgentEdgeCases:
     """Edge cases for agents"""
 
-    def test_agent_unavailable(self):
+    def test_agent_unavailable(self, monkeypatch, fresh_which):
         """Test handling when agent CLI is not available"""
-        with patch("shutil.which", return_value=None):
-            agent = ClaudeAgent()
-            assert not agent.is_available()
+        monkeypatch.setattr(shutil, "which", lambda command: None)
+
+        agent = ClaudeAgent()
+        assert not agent.is_available()
 
-    def test_both_agents_unavailable(self, sample_goal, temp_dir):
+    def test_both_agents_unavailable(self, sample_goal, temp_dir, monkeypatch, fresh_which):
         """Test when both agents are unavailable"""
         config = OrchestratorConfig(work_dir=temp_dir)
         orchestrator = Orchestrator(config, goal=sample_goal)
 
-        with patch("shutil.which", return_value=None):
-            # Initialize should warn but not fail completely
-            # (depends on implementation)
-            pass
+        monkeypatch.setattr(shutil, "which", lambda command: None)
+        # Initialize should warn but not fail completely
+        # (depends on implementation)
 
-    def test_agent_returns_empty_output(self):
-        """Test handling empty agent output"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="",
-                stderr="",
-            )
 
-            agent = ClaudeAgent()
-            response = agent.execute("Test")
+class FakeMaster:
+    """Master that always decides the same thing and returns a fixed verification"""
 
-            assert response.success
-            assert response.output == ""
+    def __init__(self, decision, verification):
+        self.decision = decision
+        self.verification = verification
+
+    def decide_next_step(self, goal_description, current_state, history):
+        return self.decision
+
+    def verify_implementation(self, instruction, response):
+        return self.verification
+
+    def create_correction(self, original_instruction, issues):
+        return Instruction(prompt="Fix", max_attempts=0)
+
+
+class FakeWorker:
+    """Worker whose every implementation succeeds"""
+
+    def implement_step(self, instruction):
+        return AgentResponse(success=True, output="Done")
+
+
+class FakeTracker:
+    """Progress tracker that only counts recorded iterations"""
+
+    def __init__(self):
+        self.iterations = 0
 
-    def test_agent_returns_invalid_json(self):
-        """Test handling invalid JSON from agent"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="Not valid JSON {{{",
-                stderr="",
-            )
+    def start(self):
+        pass
 
-            agent = ClaudeAgent()
-            response = agent.execute("Test")
+    def record_iteration(self, **kwargs):
+        self.iterations += 1
 
-            # Should still succeed but with raw output
-            assert response.success
-            assert "Not valid JSON" in response.output
+    def mark_blocked(self, reason):
+        pass
+
+    def mark_completed(self):
+        pass
+
+    def mark_failed(self, error):
+        pass
 
 
 class TestCorrectionEdgeCases:
@@ -144,36 +158,22 @@ class TestCorrectionEdgeCases:
             max_iterations=10,
             max_correction_attempts=3,
         )
-        orchestrator = Orchestrator(config, goal=simple_goal)
-
-        with patch.object(orchestrator, "initialize", return_value=True), \
-             patch.object(orchestrator, "_master_role") as mock_master, \
-             patch.object(orchestrator, "_worker_role") as mock_worker, \
-             patch.object(orchestrator, "_progress_tracker") as mock_tracker:
-
-            # Always fail verification
-            mock_master.decide_next_step.return_value = Decision(
-                type=DecisionType.IMPLEMENT, instruction="Do"
-            )
-            mock_master.verify_implementation.return_value = VerificationResult(
-                passed=False, score=0.1, issues=["Always fails"]
-            )
-            mock_master.create_correction.return_value = Mock(
-                prompt="Fix", max_attempts=0  # Decreasing attempts
-            )
-            mock_worker.implement_step.return_value = AgentResponse(
-                success=True, output="Done"
-            )
-
-            mock_tracker.start = Mock()
-            mock_tracker.record_iteration = Mock()
-            mock_tracker.mark_blocked = Mock()
+        # Always fail verification
+        orchestrator = Orchestrator(
+            config,
+            goal=simple_goal,
+            master_role=FakeMaster(
+                Decision(type=DecisionType.IMPLEMENT, instruction="Do"),
+                VerificationResult(passed=False, score=0.1, issues=["Always fails"]),
+            ),
+            worker_role=FakeWorker(),
+            progress_tracker=FakeTracker(),
+        )
 
-            orchestrator._history = []
-            orchestrator.run()
+        orchestrator.run()
 
-            # Should stop at max iterations, not loop forever
-            assert orchestrator._iteration <= config.max_iterations
+        # Should stop at max iterations, not loop forever
+        assert orchestrator._iteration <= config.max_iterations
 
 
 class TestIterationEdgeCases:
@@ -185,32 +185,23 @@ class TestIterationEdgeCases:
             work_dir=temp_dir,
             max_iterations=3,
         )
-        orchestrator = Orchestrator(config, goal=simple_goal)
-
-        with patch.object(orchestrator, "initialize", return_value=True), \
-             patch.object(orchestrator, "_master_role") as mock_master, \
-             patch.object(orchestrator, "_worker_role") as mock_worker, \
-             patch.object(orchestrator, "_progress_tracker") as mock_tracker:
-
-            # Never complete
-            mock_master.decide_next_step.return_value = Decision(
-                type=DecisionType.IMPLEMENT, instruction="Loop forever"
-            )
-            mock_master.verify_implementation.return_value = VerificationResult(
-                passed=True, score=1.0
-            )
-            mock_worker.implement_step.return_value = AgentResponse(
-                success=True, output="Done"
-            )
-
-            mock_tracker.start = Mock()
-            mock_tracker.record_iteration = Mock()
+        # Never complete
+        orchestrator = Orchestrator(
+            config,
+            goal=simple_goal,
+            master_role=FakeMaster(
+                Decision(type=DecisionType.IMPLEMENT, instruction="Loop forever"),
+                VerificationResult(passed=True, score=1.0),
+            ),
+            worker_role=FakeWorker(),
+            progress_tracker=FakeTracker(),
+        )
 
-            result = orchestrator.run()
+        result = orchestrator.run()
 
-            assert result is False
-            assert orchestrator._iteration == 3
-            assert orchestrator.state == OrchestratorState.FAILED
+        assert result is False
+        assert orchestrator._iteration == 3
+        assert orchestrator.state == OrchestratorState.FAILED
 
     def test_zero_max_iterations(self, simple_goal, temp_dir):
         """Test with zero max iterations"""
@@ -218,16 +209,12 @@ class TestIterationEdgeCases:
             work_dir=temp_dir,
             max_iterations=0,
         )
-        orchestrator = Orchestrator(config, goal=simple_goal)
+        orchestrator = Orchestrator(config, goal=simple_goal, progress_tracker=FakeTracker())
 
-        with patch.object(orchestrator, "initialize", return_value=True), \
-             patch.object(orchestrator, "_progress_tracker") as mock_tracker:
-            mock_tracker.start = Mock()
+        result = orchestrator.run()
 
-            result = orchestrator.run()
-
-            # Should fail immediately
-            assert result is False
+        # Should fail immediately
+        assert result is False
 
 
 class TestFileSystemEdgeCases:
@@ -243,71 +230,68 @@ class TestFileSystemEdgeCases:
         # Should handle gracefully
         # (exact behavior depends on implementation)
 
-    def test_work_dir_permissions(self, simple_goal, temp_dir):
-        """Test work directory permission handling"""
-        # Create read-only directory (platform dependent)
-        readonly_dir = Path(temp_dir) / "readonly"
-        readonly_dir.mkdir()
+    @pytest.mark.parametrize("error", [PermissionError, FileNotFoundError])
+    def test_work_dir_permissions(self, simple_goal, tmp_path, monkeypatch, error):
+        """Test an unwritable work directory doesn't break initialization"""
+        def mkdir(*args, **kwargs):
+            raise error("work dir not writable")
+
+        monkeypatch.setattr(Path, "mkdir", mkdir)
+
+        config = OrchestratorConfig(work_dir=str(tmp_path / "readonly"))
+        orchestrator = Orchestrator(config, goal=simple_goal)
+
+        # Directories are only created when progress is first saved
+        assert orchestrator.initialize()
 
-        try:
-            # Try to make read-only (may not work on all platforms)
-            if os.name != "nt":  # Not Windows
-                os.chmod(readonly_dir, 0o444)
 
-            config = OrchestratorConfig(work_dir=str(readonly_dir))
-            orchestrator = Orchestrator(config, goal=simple_goal)
+# 1MB of agent output, built once at import
+_LARGE_OUTPUT = "x" * (1024 * 1024)
 
-            # Should handle gracefully
-        finally:
-            # Restore permissions for cleanup
-            if os.name != "nt":
-                os.chmod(readonly_dir, 0o755)
+# (stdout, expected substring of the output or None) per agent output case
+CLAUDE_EXECUTE_CASES = {
+    "empty": ("", ""),
+    "invalid_json": ("Not valid JSON {{{", "Not valid JSON"),
+    "large": (_LARGE_OUTPUT, "x"),
+    "binary": ("\x00\x01\x02 mixed content", None),
+    "unicode": ("Ответ на русском: привет мир 🌍", "привет"),
+    "quotes": ('Output with "quotes" and \'single quotes\'', '"quotes"'),
+    "special_json": ('{"key": "value with \t tab and \n newline"}', None),
+}
 
 
 class TestOutputEdgeCases:
     """Edge cases for output handling"""
 
-    def test_large_output_handling(self):
-        """Test handling very large agent output"""
-        with patch("subprocess.run") as mock_run:
-            # 1MB of output
-            large_output = "x" * (1024 * 1024)
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout=large_output,
-                stderr="",
-            )
+    @pytest.mark.parametrize(
+        "stdout,expected",
+        list(CLAUDE_EXECUTE_CASES.values()),
+        ids=list(CLAUDE_EXECUTE_CASES),
+    )
+    def test_claude_execute_output(self, fake_runner, claude_agent, stdout, expected):
+        """Test unusual agent output is returned without crashing"""
+        fake_runner.set_result(returncode=0, stdout=stdout, stderr="")
 
-            agent = ClaudeAgent()
-            response = agent.execute("Generate lots of output")
+        response = claude_agent.execute("Test")
 
-            assert response.success
-            assert len(response.output) > 0
+        assert response.success
+        if expected == "":
+            assert response.output == ""
+        elif expected is not None:
+            assert expected in response.output
 
-    def test_binary_output_handling(self):
-        """Test handling binary-like output"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="\x00\x01\x02 mixed content",
-                stderr="",
-            )
+    def test_large_output_capped(self, fake_runner):
+        """Test output beyond max_output_chars is truncated"""
+        fake_runner.set_result(returncode=0, stdout=_LARGE_OUTPUT, stderr="")
+        config = AgentConfig(command="claude", json_output=False, max_output_chars=64 * 1024)
 
-            agent = ClaudeAgent()
-            response = agent.execute("Test")
+        response = ClaudeAgent(config, runner=fake_runner).execute("Generate lots of output")
 
-            # Should not crash
-            assert response is not None
+        assert response.success
+        assert len(response.output) == 64 * 1024
 
 
-class TestUnicodeEdgeCases:
-    """Edge cases for unicode handling"""
-
-    def test_unicode_in_goal_and_output(self, temp_dir):
-        """Test unicode in goal and output"""
-        # Create goal with unicode
-        goal_path = Path(temp_dir) / "unicode_goal.txt"
-        goal_path.write_text("""# 日本語のゴール 🎯
+_UNICODE_GOAL = """# 日本語のゴール 🎯
 
 ## Description
 Это описание на русском языке.
@@ -321,28 +305,18 @@ class TestUnicodeEdgeCases:
 
 ## Constraints
 - Emoji support 😀
-""", encoding="utf-8")
+"""
 
-        parser = GoalParser()
-        goal = parser.parse_file(str(goal_path))
 
-        assert "日本語" in goal.title
-        assert len(goal.acceptance_criteria) == 4
-
-    def test_unicode_in_agent_response(self):
-        """Test unicode in agent response"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="Ответ на русском: привет мир 🌍",
-                stderr="",
-            )
+class TestUnicodeEdgeCases:
+    """Edge cases for unicode handling"""
 
-            agent = ClaudeAgent()
-            response = agent.execute("Test unicode")
+    def test_unicode_in_goal_and_output(self):
+        """Test unicode in goal and output"""
+        goal = GoalParser().parse_content(_UNICODE_GOAL)
 
-            assert response.success
-            assert "привет" in response.output
+        assert "日本語" in goal.title
+        assert len(goal.acceptance_criteria) == 4
 
     def test_unicode_in_decision(self):
         """Test unicode in decision messages"""
@@ -370,33 +344,3 @@ class TestSpecialCharacterEdgeCases:
 
         assert "\n" in instruction.prompt
         assert "\n" in instruction.context
-
-    def test_quotes_in_output(self):
-        """Test handling quotes in output"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout='Output with "quotes" and \'single quotes\'',
-                stderr="",
-            )
-
-            agent = ClaudeAgent()
-            response = agent.execute("Test")
-
-            assert '"quotes"' in response.output
-
-    def test_special_json_characters(self):
-        """Test handling special JSON characters"""
-        with patch("subprocess.run") as mock_run:
-            # Output with characters that need escaping in JSON
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout='{"key": "value with \t tab and \n newline"}',
-                stderr="",
-            )
-
-            agent = ClaudeAgent()
-            response = agent.execute("Test")
-
-            # Should parse without crashing
-            assert response.success
@@ -9,18 +9,18 @@ from unittest.mock import Mock, patch, MagicMock
 import json
 import tempfile
 from pathlib import Path
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from datetime import datetime
 
 from orchestrator import (
+    MemoryCheckpointBackend,
     Orchestrator,
     OrchestratorConfig,
     OrchestratorState,
     SessionState,
 )
 from agents.base import AgentType, AgentResponse
-from roles.base import Decision, DecisionType
+from roles.base import Decision, DecisionType, VerificationResult, Instruction
+from roles.master import MasterRole
 
 
 class TestOrchestratorConfig:
@@ -79,6 +79,14 @@ class TestOrchestratorInitialization:
         assert orchestrator.state == OrchestratorState.IDLE
         assert orchestrator.goal == sample_goal
 
+    def test_orchestrator_recent_history_uses_master_window(self, sample_goal, mock_agent):
+        """Test the recent-history tail follows an injected Master's window"""
+        master = MasterRole(mock_agent)
+        master.history_window = 2
+        orchestrator = Orchestrator(OrchestratorConfig(), goal=sample_goal, master_role=master)
+
+        assert orchestrator._recent_history.maxlen == 2
+
     def test_orchestrator_initialize_with_goal(self, sample_goal, temp_dir):
         """Test initialization with goal"""
         config = OrchestratorConfig(work_dir=temp_dir)
@@ -143,8 +151,8 @@ class TestOrchestratorRun:
                 type=DecisionType.IMPLEMENT,
                 instruction="Do something",
             )
-            mock_master.verify_implementation.return_value = Mock(
-                passed=True, score=0.9, issues=[]
+            mock_master.verify_implementation.return_value = VerificationResult(
+                passed=True, score=0.9
             )
 
             mock_worker.implement_step.return_value = AgentResponse(
@@ -192,13 +200,14 @@ class TestOrchestratorCheckpointing:
     def test_orchestrator_save_checkpoint(self, sample_goal, temp_dir):
         """Test saving checkpoint"""
         config = OrchestratorConfig(work_dir=temp_dir, session_dir="sessions")
-        orchestrator = Orchestrator(config, goal=sample_goal)
+        backend = MemoryCheckpointBackend()
+        orchestrator = Orchestrator(config, goal=sample_goal, checkpoint_backend=backend)
 
         # Create session
         orchestrator._session = SessionState(
             session_id="test123",
-            started_at=orchestrator._session.started_at if orchestrator._session else __import__("datetime").datetime.now(),
-            updated_at=__import__("datetime").datetime.now(),
+            started_at=orchestrator._session.started_at if orchestrator._session else datetime.now(),
+            updated_at=datetime.now(),
             state=OrchestratorState.RUNNING,
             iteration=5,
             goal_title="Test Goal",
@@ -209,14 +218,16 @@ class TestOrchestratorCheckpointing:
 
         path = orchestrator._save_checkpoint()
 
-        assert Path(path).exists()
+        assert json.loads(backend.load(path))["iteration"] == 5
+        assert not Path(path).exists()
 
     def test_orchestrator_load_checkpoint(self, sample_goal, temp_dir):
         """Test loading checkpoint"""
         config = OrchestratorConfig(work_dir=temp_dir)
-        orchestrator = Orchestrator(config, goal=sample_goal)
+        backend = MemoryCheckpointBackend()
+        orchestrator = Orchestrator(config, goal=sample_goal, checkpoint_backend=backend)
 
-        # Create checkpoint file
+        # Create checkpoint
         checkpoint_data = {
             "session_id": "test456",
             "started_at": "2024-01-01T00:00:00",
@@ -229,7 +240,7 @@ class TestOrchestratorCheckpointing:
         }
 
         checkpoint_path = Path(temp_dir) / "checkpoint.json"
-        checkpoint_path.write_text(json.dumps(checkpoint_data))
+        backend.save(str(checkpoint_path), json.dumps(checkpoint_data).encode())
 
         # Mock initialize
         with patch.object(orchestrator, "initialize", return_value=True):
@@ -238,6 +249,13 @@ class TestOrchestratorCheckpointing:
         assert result is True
         assert orchestrator._iteration == 3
 
+    def test_orchestrator_unknown_checkpoint_backend(self, sample_goal):
+        """Test an unknown backend name is rejected with the allowed values"""
+        config = OrchestratorConfig(checkpoint_backend="s3")
+
+        with pytest.raises(ValueError, match="file, memory"):
+            Orchestrator(config, goal=sample_goal)
+
 
 class TestOrchestratorStatus:
     """Tests for status reporting"""
@@ -280,7 +298,7 @@ class TestOrchestratorVerification:
         orchestrator._worker_role = Mock()
 
         # First correction fails, second succeeds
-        orchestrator._master_role.create_correction.return_value = Mock(
+        orchestrator._master_role.create_correction.return_value = Instruction(
             prompt="Fix issues",
             max_attempts=2,
         )
@@ -288,19 +306,14 @@ class TestOrchestratorVerification:
             success=True, output="Fixed"
         )
 
-        call_count = [0]
-        def verify_side_effect(*args):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return Mock(passed=False, issues=["Still broken"])
-            return Mock(passed=True, issues=[])
-
-        orchestrator._master_role.verify_implementation.side_effect = verify_side_effect
+        orchestrator._master_role.verify_implementation.side_effect = iter([
+            VerificationResult(passed=False, issues=["Still broken"]),
+            VerificationResult(passed=True),
+        ])
 
-        from roles.base import Instruction
         instruction = Instruction(prompt="Test", max_attempts=3)
         response = AgentResponse(success=False, output="")
-        verification = Mock(passed=False, issues=["Error"])
+        verification = VerificationResult(passed=False, issues=["Error"])
 
         orchestrator._history = []
         orchestrator._progress_tracker = Mock()
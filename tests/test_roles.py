@@ -2,46 +2,80 @@
 Tests for Role implementations
 
 Tests:
-1. test_master_decide_implement
-2. test_master_decide_skip
-3. test_master_decide_done
-4. test_master_verify_success
-5. test_master_verify_failure
-6. test_worker_implement_success
-7. test_worker_implement_partial
-8. test_role_swap_claude_to_codex
-9. test_role_swap_codex_to_claude
-10. test_role_configuration_validation
+1. test_master_decide (implement, skip, done, error)
+2. test_master_verify_success
+3. test_master_verify_failure
+4. test_worker_implement_success
+5. test_worker_implement_partial
+6. test_role_swap (Claude to Codex and back)
+7. test_role_configuration_validation
 """
 
 import pytest
 from unittest.mock import Mock, patch
 import json
-
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import asyncio
+from collections import deque
 
 from agents.base import AgentType, AgentResponse, AgentConfig
 from roles.base import Decision, DecisionType, VerificationResult, Instruction, IRoleStrategy
 from roles.master import MasterRole
 from roles.worker import WorkerRole
+from roles.cache import ResponseCache
+
+
+# Agent outputs shared by the Master tests, serialized once at import
+_DECIDE_IMPLEMENT_JSON = json.dumps({
+    "decision_type": "IMPLEMENT",
+    "instruction": "Create the user model",
+    "reason": "Next step in the plan",
+    "expected_outcome": "User model created",
+})
+_DECIDE_SKIP_JSON = json.dumps({
+    "decision_type": "SKIP",
+    "instruction": "",
+    "reason": "Already implemented",
+    "expected_outcome": "",
+})
+_DECIDE_DONE_JSON = json.dumps({
+    "decision_type": "DONE",
+    "instruction": "",
+    "reason": "All criteria met",
+    "expected_outcome": "",
+})
+_VERIFY_PASS_JSON = json.dumps({
+    "passed": True,
+    "score": 0.95,
+    "issues": [],
+    "suggestions": ["Add more comments"],
+})
+_VERIFY_FAIL_JSON = json.dumps({
+    "passed": False,
+    "score": 0.3,
+    "issues": ["Missing error handling", "No tests"],
+    "suggestions": ["Add try/except"],
+})
 
 
 class TestMasterDecisions:
     """Tests for Master role decisions"""
 
-    def test_master_decide_implement(self, mock_agent):
-        """Test Master deciding to implement"""
-        mock_agent.execute.return_value = AgentResponse(
-            success=True,
-            output=json.dumps({
-                "decision_type": "IMPLEMENT",
-                "instruction": "Create the user model",
-                "reason": "Next step in the plan",
-                "expected_outcome": "User model created",
-            }),
-        )
+    @pytest.mark.parametrize("payload, expected, instruction", [
+        (_DECIDE_IMPLEMENT_JSON, DecisionType.IMPLEMENT, "Create the user model"),
+        (_DECIDE_SKIP_JSON, DecisionType.SKIP, ""),
+        (_DECIDE_DONE_JSON, DecisionType.DONE, ""),
+        (None, DecisionType.ERROR, ""),  # None means the agent call failed
+    ])
+    def test_master_decide(self, mock_agent, payload, expected, instruction):
+        """Test the Master's decision for each kind of agent answer"""
+        if payload is None:
+            mock_agent.execute.return_value = AgentResponse(
+                success=False,
+                output="",
+                error="Agent failed",
+            )
+        else:
+            mock_agent.execute.return_value = AgentResponse(success=True, output=payload)
 
         master = MasterRole(mock_agent)
         decision = master.decide_next_step(
@@ -50,67 +84,106 @@ class TestMasterDecisions:
             history=[],
         )
 
-        assert decision.type == DecisionType.IMPLEMENT
-        assert "user" in decision.instruction.lower() or decision.instruction != ""
+        assert decision.type == expected
+        assert decision.instruction == instruction
 
-    def test_master_decide_skip(self, mock_agent):
-        """Test Master deciding to skip"""
+    def test_master_decide_fenced_json(self, mock_agent):
+        """Test decision JSON wrapped in a markdown code block"""
         mock_agent.execute.return_value = AgentResponse(
             success=True,
-            output=json.dumps({
-                "decision_type": "SKIP",
-                "instruction": "",
-                "reason": "Already implemented",
-                "expected_outcome": "",
-            }),
+            output='Here is my decision:\n```json\n{"decision_type": "done"}\n```\nThanks',
         )
 
         master = MasterRole(mock_agent)
-        decision = master.decide_next_step(
-            goal_description="Already done task",
-            current_state={"goal_progress": 100},
-            history=[],
-        )
+        decision = master.decide_next_step("Goal", {}, [])
 
-        assert decision.type == DecisionType.SKIP
+        assert decision.type == DecisionType.DONE
 
-    def test_master_decide_done(self, mock_agent):
-        """Test Master deciding goal is done"""
+    def test_master_decide_escaped_fields(self, mock_agent):
+        """Test escaped quotes and newlines survive decision parsing"""
         mock_agent.execute.return_value = AgentResponse(
             success=True,
             output=json.dumps({
-                "decision_type": "DONE",
-                "instruction": "",
-                "reason": "All criteria met",
-                "expected_outcome": "",
+                "decision_type": "implement",
+                "instruction": 'Print "hello"\nthen exit',
+                "reason": "Next",
             }),
         )
 
         master = MasterRole(mock_agent)
-        decision = master.decide_next_step(
-            goal_description="Completed goal",
-            current_state={"goal_progress": 100, "completed_criteria": 5, "total_criteria": 5},
-            history=[],
-        )
+        decision = master.decide_next_step("Goal", {}, [])
 
-        assert decision.type == DecisionType.DONE
+        assert decision.type == DecisionType.IMPLEMENT
+        assert decision.instruction == 'Print "hello"\nthen exit'
 
-    def test_master_decide_error_on_failure(self, mock_agent):
-        """Test Master returns error on agent failure"""
-        mock_agent.execute.return_value = AgentResponse(
-            success=False,
-            output="",
-            error="Agent failed",
-        )
+    def test_master_summarize_recent_history(self, mock_agent):
+        """Test only the most recent steps are summarized"""
+        history = [{"instruction": f"step {i}", "success": True} for i in range(8)]
 
         master = MasterRole(mock_agent)
-        decision = master.decide_next_step(
-            goal_description="Test",
-            current_state={},
-            history=[],
-        )
+        summary = master._summarize_history(history)
+
+        assert summary.count("Step ") == master.history_window
+        assert "step 7" in summary
+        assert "step 2" not in summary
+        assert summary == master._summarize_history(deque(history, maxlen=master.history_window))
 
-        assert decision.type == DecisionType.ERROR
+    def test_master_summarize_deque_longer_than_window(self, mock_agent):
+        """Test a deque longer than an instance's smaller window is cut to its tail"""
+        history = deque({"instruction": f"step {i}", "success": True} for i in range(5))
+
+        master = MasterRole(mock_agent)
+        master.history_window = 2
+        summary = master._summarize_history(history)
+
+        assert summary.count("Step ") == 2
+        assert "step 3" in summary and "step 4" in summary
+
+
+class TestMasterStreamingDecisions:
+    """Tests for streamed Master decisions"""
+
+    def test_master_stream_stops_once_done_settled(self, mock_agent):
+        """Test streaming stops reading after a settled DONE decision"""
+        consumed = []
+
+        def chunks():
+            for chunk in ['{"decision_type": "DONE", ', '"reason": "All \\"criteria\\" met", ', '"instruction": "...']:
+                consumed.append(chunk)
+                yield chunk
+
+        mock_agent.execute_stream.return_value = chunks()
+
+        master = MasterRole(mock_agent, stream_decisions=True)
+        decision = master.decide_next_step("Goal", {}, [])
+
+        assert decision.type == DecisionType.DONE
+        assert decision.reason == 'All "criteria" met'
+        assert len(consumed) == 2
+        assert not mock_agent.execute.called
+
+    def test_master_stream_settles_type_split_across_chunks(self, mock_agent):
+        """Test a SKIP whose type arrives one character at a time still settles early"""
+        output = "Thinking it over first. " * 20 + '{"decision_type": "SKIP", "reason": "Done already"} trailing'
+        mock_agent.execute_stream.return_value = iter(output)
+
+        master = MasterRole(mock_agent, stream_decisions=True)
+        output_seen, settled = master._stream_decision("Goal")
+
+        assert settled.type == DecisionType.SKIP
+        assert settled.reason == "Done already"
+        assert output_seen.endswith('"Done already"')
+
+    def test_master_stream_parses_full_implement(self, mock_agent):
+        """Test IMPLEMENT decisions are parsed from the complete stream"""
+        output = json.dumps({"decision_type": "IMPLEMENT", "instruction": "Build it", "reason": "Next"})
+        mock_agent.execute_stream.return_value = iter([output[:10], output[10:]])
+
+        master = MasterRole(mock_agent, stream_decisions=True)
+        decision = master.decide_next_step("Goal", {}, [])
+
+        assert decision.type == DecisionType.IMPLEMENT
+        assert decision.instruction == "Build it"
 
 
 class TestMasterVerification:
@@ -120,12 +193,7 @@ class TestMasterVerification:
         """Test successful verification"""
         mock_agent.execute.return_value = AgentResponse(
             success=True,
-            output=json.dumps({
-                "passed": True,
-                "score": 0.95,
-                "issues": [],
-                "suggestions": ["Add more comments"],
-            }),
+            output=_VERIFY_PASS_JSON,
         )
 
         master = MasterRole(mock_agent)
@@ -138,12 +206,7 @@ class TestMasterVerification:
         """Test failed verification"""
         mock_agent.execute.return_value = AgentResponse(
             success=True,
-            output=json.dumps({
-                "passed": False,
-                "score": 0.3,
-                "issues": ["Missing error handling", "No tests"],
-                "suggestions": ["Add try/except"],
-            }),
+            output=_VERIFY_FAIL_JSON,
         )
 
         master = MasterRole(mock_agent)
@@ -201,37 +264,54 @@ class TestWorkerImplementation:
         assert not result.passed
         assert len(result.issues) > 0
 
+    def test_worker_routes_simple_instruction_to_light_agent(self, mock_agent):
+        """Test short unconstrained instructions go to the light agent"""
+        light_agent = Mock()
+        light_agent.execute.return_value = AgentResponse(success=True, output="Done")
 
-class TestRoleSwapping:
-    """Tests for role swapping"""
+        worker = WorkerRole(mock_agent, light_agent=light_agent)
+        worker.implement_step(Instruction(prompt="Rename foo to bar"))
 
-    def test_role_swap_claude_to_codex(self, mock_claude_agent, mock_codex_agent):
-        """Test swapping Claude from Master to Worker"""
-        # Initially Claude is Master
-        master = MasterRole(mock_claude_agent)
-        worker = WorkerRole(mock_codex_agent)
+        assert light_agent.execute.called
+        assert not mock_agent.execute.called
 
-        assert master.agent.agent_type == AgentType.CLAUDE
-        assert worker.agent.agent_type == AgentType.CODEX
+    def test_worker_routes_constrained_instruction_to_agent(self, mock_agent, sample_instruction):
+        """Test constrained instructions stay on the full agent"""
+        mock_agent.execute.return_value = AgentResponse(success=True, output="Done")
+        light_agent = Mock()
 
-        # Swap roles
-        new_master = MasterRole(mock_codex_agent)
-        new_worker = WorkerRole(mock_claude_agent)
+        worker = WorkerRole(mock_agent, light_agent=light_agent)
+        worker.implement_step(sample_instruction)
 
-        assert new_master.agent.agent_type == AgentType.CODEX
-        assert new_worker.agent.agent_type == AgentType.CLAUDE
+        assert mock_agent.execute.called
+        assert not light_agent.execute.called
 
-    def test_role_swap_codex_to_claude(self, mock_claude_agent, mock_codex_agent):
-        """Test swapping Codex from Worker to Master"""
-        # Same as above but explicit
-        master = MasterRole(mock_codex_agent)
-        worker = WorkerRole(mock_claude_agent)
 
-        assert master.agent.agent_type == AgentType.CODEX
-        assert worker.agent.agent_type == AgentType.CLAUDE
+class TestRoleSwapping:
+    """Tests for role swapping"""
+
+    @pytest.mark.parametrize("master_type, worker_type", [
+        (AgentType.CLAUDE, AgentType.CODEX),
+        (AgentType.CODEX, AgentType.CLAUDE),
+    ])
+    def test_role_swap(self, master_type, worker_type, mock_claude_agent, mock_codex_agent):
+        """Test swapping which agent holds the Master and Worker roles"""
+        agents = {AgentType.CLAUDE: mock_claude_agent, AgentType.CODEX: mock_codex_agent}
+        master = MasterRole(agents[master_type])
+        worker = WorkerRole(agents[worker_type])
+
+        assert master.agent.agent_type == master_type
+        assert worker.agent.agent_type == worker_type
         assert master.role_name == "master"
         assert worker.role_name == "worker"
 
+        # Swap roles
+        new_master = MasterRole(worker.agent)
+        new_worker = WorkerRole(master.agent)
+
+        assert new_master.agent.agent_type == worker_type
+        assert new_worker.agent.agent_type == master_type
+
 
 class TestRoleConfiguration:
     """Tests for role configuration"""
@@ -289,3 +369,191 @@ class TestMasterCorrection:
         correction = master.create_correction(sample_instruction, ["Error"])
 
         assert len(correction.constraints) > len(sample_instruction.constraints)
+
+    def test_master_correction_shares_file_lists(self, mock_agent, sample_instruction):
+        """Test corrections reuse the frozen original's file lists"""
+        master = MasterRole(mock_agent)
+        correction = master.create_correction(sample_instruction, ["Error"])
+
+        assert correction.files_to_create is sample_instruction.files_to_create
+        with pytest.raises(AttributeError):
+            correction.prompt = "changed"
+
+
+class TestMasterAnalysis:
+    """Tests for Master codebase analysis"""
+
+    def test_master_analyze_fenced_json(self, mock_agent):
+        """Test analysis JSON wrapped in a markdown code block"""
+        mock_agent.execute.return_value = AgentResponse(
+            success=True,
+            output='```json\n{"entry_points": ["main.py"]}\n```',
+        )
+
+        master = MasterRole(mock_agent)
+        analysis = master.analyze_codebase("/tmp")
+
+        assert analysis == {"entry_points": ["main.py"]}
+
+    def test_master_analyze_plain_text(self, mock_agent):
+        """Test non-JSON analysis is returned as text"""
+        mock_agent.execute.return_value = AgentResponse(
+            success=True,
+            output="The project has one module.",
+        )
+
+        master = MasterRole(mock_agent)
+        analysis = master.analyze_codebase("/tmp")
+
+        assert analysis == {"analysis": "The project has one module."}
+
+
+class TestMasterResponseCache:
+    """Tests for Master response caching"""
+
+    def test_master_decide_reuses_cached_response(self, mock_agent):
+        """Test identical decision prompts only hit the agent once"""
+        mock_agent.execute.return_value = AgentResponse(
+            success=True,
+            output=json.dumps({"decision_type": "IMPLEMENT", "instruction": "Do it"}),
+        )
+
+        master = MasterRole(mock_agent)
+        first = master.decide_next_step("Goal", {"iteration": 1}, [])
+        second = master.decide_next_step("Goal", {"iteration": 1}, [])
+
+        assert first.type == second.type == DecisionType.IMPLEMENT
+        assert mock_agent.execute.call_count == 1
+
+    def test_master_cache_skips_unparseable_output(self, mock_agent):
+        """Test outputs that fail to parse are not cached"""
+        mock_agent.execute.return_value = AgentResponse(success=True, output="not json")
+
+        master = MasterRole(mock_agent)
+        master.decide_next_step("Goal", {}, [])
+        master.decide_next_step("Goal", {}, [])
+
+        assert mock_agent.execute.call_count == 2
+
+    def test_master_cache_disabled(self, mock_agent, sample_instruction, sample_agent_response):
+        """Test cache_size=0 always calls the agent"""
+        mock_agent.execute.return_value = AgentResponse(
+            success=True,
+            output=json.dumps({"passed": True, "score": 1.0}),
+        )
+
+        master = MasterRole(mock_agent, cache_size=0)
+        master.verify_implementation(sample_instruction, sample_agent_response)
+        master.verify_implementation(sample_instruction, sample_agent_response)
+
+        assert mock_agent.execute.call_count == 2
+
+    def test_master_cache_ignores_state_key_order(self, mock_agent):
+        """Test logically equal states share a cache entry"""
+        mock_agent.execute.return_value = AgentResponse(
+            success=True,
+            output=json.dumps({"decision_type": "SKIP"}),
+        )
+
+        master = MasterRole(mock_agent)
+        master.decide_next_step("Goal", {"iteration": 2, "state": "running"}, [])
+        master.decide_next_step("Goal", {"state": "running", "iteration": 2}, [])
+
+        assert mock_agent.execute.call_count == 1
+
+
+class TestConcurrentVerification:
+    """Tests for concurrent verification"""
+
+    def test_verify_all_preserves_order(self, mock_agent, sample_instruction):
+        """Test concurrent verification returns results in input order"""
+        worker = WorkerRole(mock_agent)
+        pairs = [
+            (sample_instruction, AgentResponse(success=True, output="ok", files_created=["hello.py"])),
+            (sample_instruction, AgentResponse(success=False, output="", error="boom", exit_code=1)),
+        ]
+
+        results = asyncio.run(worker.a_verify_all(pairs, max_concurrency=2))
+
+        assert [r.passed for r in results] == [True, False]
+
+    def test_master_coalesces_identical_verifications(self, mock_agent, sample_instruction, sample_agent_response):
+        """Test identical in-flight verifications share one agent call"""
+        mock_agent.execute.return_value = AgentResponse(
+            success=True,
+            output=json.dumps({"passed": True, "score": 1.0, "issues": [], "suggestions": []}),
+        )
+        master = MasterRole(mock_agent, cache_size=0)
+        pairs = [(sample_instruction, sample_agent_response)] * 3
+
+        results = asyncio.run(master.a_verify_all(pairs))
+
+        assert [r.passed for r in results] == [True, True, True]
+        assert mock_agent.execute.call_count == 1
+        assert master._inflight == {}
+
+
+class TestMasterBatchVerification:
+    """Tests for batched Master verification"""
+
+    def test_master_verify_batch_single_call(self, mock_agent, sample_instruction, sample_agent_response):
+        """Test several implementations are verified with one agent call"""
+        mock_agent.execute.return_value = AgentResponse(
+            success=True,
+            output=json.dumps([
+                {"id": 2, "passed": False, "score": 0.2, "issues": ["Broken"]},
+                {"id": 1, "passed": True, "score": 0.9},
+            ]),
+        )
+
+        master = MasterRole(mock_agent)
+        results = master.verify_implementations([
+            (sample_instruction, sample_agent_response),
+            (sample_instruction, sample_agent_response),
+            (sample_instruction, sample_agent_response),
+        ])
+
+        assert mock_agent.execute.call_count == 1
+        assert [r.passed for r in results] == [True, False, False]
+        assert results[1].issues == ["Broken"]
+        assert "#3" in results[2].issues[0]
+
+    def test_master_verify_batch_agent_failure(self, mock_agent, sample_instruction, sample_agent_response):
+        """Test agent failure fails every implementation in the batch"""
+        mock_agent.execute.return_value = AgentResponse(success=False, output="", error="down")
+
+        master = MasterRole(mock_agent)
+        results = master.verify_implementations([
+            (sample_instruction, sample_agent_response),
+            (sample_instruction, sample_agent_response),
+        ])
+
+        assert len(results) == 2
+        assert not any(r.passed for r in results)
+
+
+class TestResponseCache:
+    """Tests for the response cache"""
+
+    def test_cache_promotes_hot_entries(self):
+        """Test frequently hit prompts survive LRU eviction"""
+        cache = ResponseCache(max_size=2, promote_after=3, promote_interval=4)
+        cache.put("hot prompt", "hot output")
+        for _ in range(4):
+            assert cache.get("hot prompt") == "hot output"
+
+        cache.put("cold 1", "a")
+        cache.put("cold 2", "b")
+        cache.put("cold 3", "c")
+
+        assert cache.get("hot prompt") == "hot output"
+        assert cache.get("cold 1") is None
+
+    def test_cache_ignores_trailing_whitespace_only(self):
+        """Test trailing whitespace is ignored but indentation is not"""
+        cache = ResponseCache()
+        cache.put("def f():\n    return 1\n", "passed")
+
+        assert cache.get("def f():  \n    return 1") == "passed"
+        assert cache.get("def f():\nreturn 1") is None
+        assert cache.get("def f(): return 1") is None
@@ -3,19 +3,20 @@ Tests for Verification checkers
 
 Tests:
 1. test_verify_code_syntax
-2. test_verify_test_pass
+2. test_verify_test_run (pass, fail, custom command)
 3. test_verify_goal_match
 4. test_verify_diff_analysis
 5. test_verify_quality_metrics
 """
 
 import pytest
+from dataclasses import replace
 from unittest.mock import Mock, patch
 import tempfile
-from pathlib import Path
-
+import io
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from types import SimpleNamespace
+from pathlib import Path
 
 from verification.checker import (
     VerificationChecker,
@@ -25,23 +26,74 @@ from verification.checker import (
     QualityChecker,
     CheckResult,
     VerificationReport,
+    _tool_available,
 )
+from verification.impact import TestImpactIndex
 from agents.base import AgentResponse
 
 
+# Python sources shared by the syntax tests, encoded once at import
+_VALID_PY = b"def hello():\n    return 'world'\n"
+_INVALID_PY = b"def hello(\n    return 'broken syntax"
+
+# Long file with debug output and a TODO, for the quality checker
+_BAD_PY = b'x = 1\n' * 600 + b'print("debug")\n# TODO: fix this\n'
+
+# Goal matcher answers, shared since AgentResponse is frozen
+_AR_FULL_MATCH = AgentResponse(
+    success=True,
+    output='{"matches": true, "score": 0.95, "matched_criteria": ["All"], "unmatched_criteria": [], "assessment": "Good match"}',
+)
+_AR_PARTIAL = AgentResponse(
+    success=True,
+    output='{"matches": false, "score": 0.5, "matched_criteria": ["GET"], "unmatched_criteria": ["POST"], "assessment": "Partial"}',
+)
+_AR_PERFECT = AgentResponse(
+    success=True,
+    output='{"matches": true, "score": 1.0, "matched_criteria": [], "unmatched_criteria": [], "assessment": "Perfect"}',
+)
+
+# Report with two of three checks passing; tests only read it
+_CR_SYNTAX = CheckResult(name="syntax", passed=True, score=1.0)
+_TEMPLATE_REPORT = VerificationReport(
+    passed=False,
+    overall_score=0.65,
+    checks=[
+        _CR_SYNTAX,
+        CheckResult(name="tests", passed=False, score=0.5),
+        CheckResult(name="quality", passed=True, score=0.8),
+    ],
+    summary="2/3 checks passed",
+)
+
+
+def _finished_process(returncode, output):
+    """Stand-in for a test process that printed output and exited"""
+    return SimpleNamespace(
+        returncode=returncode,
+        stdout=io.StringIO(output),
+        wait=lambda timeout=None: returncode,
+        kill=lambda: None,
+    )
+
+
+@pytest.fixture(scope="module")
+def valid_py(tmp_path_factory):
+    """_VALID_PY written once per module, for tests that only read it"""
+    path = tmp_path_factory.mktemp("valid") / "valid.py"
+    path.write_bytes(_VALID_PY)
+    return path
+
+
 class TestSyntaxChecker:
     """Tests for syntax checking"""
 
-    def test_verify_code_syntax_python_valid(self, temp_dir):
+    def test_verify_code_syntax_python_valid(self, valid_py):
         """Test syntax check for valid Python code"""
-        # Create a valid Python file
-        code_file = Path(temp_dir) / "valid.py"
-        code_file.write_text("def hello():\n    return 'world'\n")
-
         checker = SyntaxChecker()
         result = checker.check({
-            "files": ["valid.py"],
-            "work_dir": temp_dir,
+            "files": [valid_py.name],
+            "work_dir": str(valid_py.parent),
         })
 
         assert result.passed
@@ -51,7 +103,7 @@ class TestSyntaxChecker:
         """Test syntax check for invalid Python code"""
         # Create an invalid Python file
         code_file = Path(temp_dir) / "invalid.py"
-        code_file.write_text("def hello(\n    return 'broken syntax")
+        code_file.write_bytes(_INVALID_PY)
 
         checker = SyntaxChecker()
         result = checker.check({
@@ -59,9 +111,9 @@ class TestSyntaxChecker:
             "work_dir": temp_dir,
         })
 
-        # May or may not fail depending on py_compile availability
-        # Main thing is it doesn't crash
-        assert isinstance(result, CheckResult)
+        assert not result.passed
+        assert result.score == 0.0
+        assert result.details["errors"][0].startswith("invalid.py:2: ")
 
     def test_verify_code_syntax_no_files(self):
         """Test syntax check with no files"""
@@ -71,62 +123,195 @@ class TestSyntaxChecker:
         assert result.passed
         assert "No files" in result.message
 
+    def test_verify_code_syntax_multiple_files(self, temp_dir):
+        """Test syntax check reports errors per file across several files"""
+        for i in range(4):
+            (Path(temp_dir) / f"module{i}.py").write_bytes(b"VALUE = %d\n" % i)
+
+        checker = SyntaxChecker()
+        result = checker.check({
+            "files": [f"module{i}.py" for i in range(4)] + ["missing.py"],
+            "work_dir": temp_dir,
+        })
+
+        assert not result.passed
+        assert result.details["errors"] == ["File not found: missing.py"]
+        assert result.score == pytest.approx(0.8)
+
+    def test_verify_code_syntax_reports_each_broken_file(self, temp_dir):
+        """Test each broken file is reported with its line number"""
+        (Path(temp_dir) / "good.py").write_bytes(b"VALUE = 1\n")
+        (Path(temp_dir) / "bad1.py").write_bytes(b"def broken(\n")
+        (Path(temp_dir) / "bad2.py").write_bytes(b"class :\n")
+
+        checker = SyntaxChecker()
+        result = checker.check({
+            "files": ["bad1.py", "good.py", "bad2.py"],
+            "work_dir": temp_dir,
+        })
+
+        assert not result.passed
+        errors = result.details["errors"]
+        assert len(errors) == 2
+        assert errors[0].startswith("bad1.py:1:")
+        assert errors[1].startswith("bad2.py:1:")
+
+    def test_verify_code_syntax_nested_and_unknown_files(self, temp_dir):
+        """Test files in subdirectories are found and unknown types skipped"""
+        package = Path(temp_dir) / "pkg"
+        package.mkdir()
+        (package / "module.py").write_bytes(b"VALUE = 1\n")
+
+        checker = SyntaxChecker()
+        result = checker.check({
+            "files": ["pkg/module.py", "pkg/missing.py", "README", "notes.md"],
+            "work_dir": temp_dir,
+        })
+
+        assert result.details["errors"] == ["File not found: pkg/missing.py"]
+
+    def test_verify_code_syntax_missing_tool_skipped(self, temp_dir):
+        """Test files for an unavailable tool are skipped without spawning it"""
+        (Path(temp_dir) / "main.rs").write_bytes(b"fn main() {}\n")
+        (Path(temp_dir) / "a.c").write_bytes(b"int main(void) { return 0; }\n")
+        (Path(temp_dir) / "b.c").write_bytes(b"int x;\n")
+
+        _tool_available.cache_clear()
+        try:
+            with patch("verification.checker.shutil.which", return_value=None), \
+                    patch("verification.checker.subprocess.run") as mock_run:
+                result = SyntaxChecker().check({
+                    "files": ["main.rs", "a.c", "b.c"],
+                    "work_dir": temp_dir,
+                })
+        finally:
+            _tool_available.cache_clear()
+
+        assert result.passed
+        assert not mock_run.called
+
 
 class TestTestChecker:
     """Tests for test execution checking"""
 
-    def test_verify_test_pass(self, temp_dir):
-        """Test running tests that pass"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="5 passed in 0.5s",
-                stderr="",
-            )
+    @pytest.mark.parametrize("returncode, output, context, passed", [
+        (0, "5 passed in 0.5s", {"language": "python"}, True),
+        (1, "3 passed, 2 failed\nAssertionError\n", {"language": "python"}, False),
+        (0, "All tests passed", {"test_command": "npm test"}, True),
+    ])
+    def test_verify_test_run(self, temp_dir, returncode, output, context, passed):
+        """Test passing, failing and custom-command test runs"""
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value = _finished_process(returncode, output)
 
             checker = TestChecker()
-            result = checker.check({
-                "work_dir": temp_dir,
-                "language": "python",
-            })
+            result = checker.check({"work_dir": temp_dir, **context})
 
-            assert result.passed
+        assert result.passed is passed
+        if passed:
             assert result.score >= 0.9
+        else:
+            assert result.score < 1.0
+
+    def test_verify_test_multiple_languages(self, temp_dir):
+        """Test suites of several languages run once each and merge"""
+        outputs = {
+            "python": _finished_process(0, "4 passed in 0.1s\n"),
+            "npm": _finished_process(1, "1 passed, 1 failed\n"),
+        }
 
-    def test_verify_test_fail(self, temp_dir):
-        """Test running tests that fail"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=1,
-                stdout="3 passed, 2 failed",
-                stderr="AssertionError",
-            )
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.side_effect = lambda cmd, **kwargs: outputs[cmd[0]]
 
             checker = TestChecker()
             result = checker.check({
                 "work_dir": temp_dir,
-                "language": "python",
+                "languages": ["python", "javascript", "typescript"],
             })
 
-            assert not result.passed
-            assert result.score < 1.0
-
-    def test_verify_test_custom_command(self, temp_dir):
-        """Test running with custom test command"""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                returncode=0,
-                stdout="All tests passed",
-                stderr="",
-            )
-
-            checker = TestChecker()
+        assert mock_popen.call_count == 2
+        assert not result.passed
+        assert result.details["stats"]["total"] == 6
+        assert result.message == "Tests: 5/6 passed"
+        assert result.details["suites"]["python"]["passed"]
+        assert not result.details["suites"]["javascript"]["passed"]
+
+    def test_verify_test_runs_impacted_tests_only(self, temp_dir):
+        """Test a cached impact index limits the run to affected test files"""
+        root = Path(temp_dir)
+        (root / "app").mkdir()
+        (root / "app" / "util.py").write_bytes(b"def helper(): return 1\n")
+        (root / "app" / "service.py").write_bytes(b"from app.util import helper\n")
+        (root / "tests").mkdir()
+        (root / "tests" / "test_service.py").write_bytes(b"from app import service\n")
+        (root / "tests" / "test_other.py").write_bytes(b"import json\n")
+
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value = _finished_process(0, "1 passed in 0.1s\n")
+
+            checker = TestChecker(cache_dir=str(root / ".cache"))
             result = checker.check({
                 "work_dir": temp_dir,
-                "test_command": "npm test",
+                "language": "python",
+                "files": ["app/util.py"],
             })
 
-            assert result.passed
+        assert result.passed
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[-1] == str(Path("tests") / "test_service.py")
+        assert not any("test_other" in part for part in cmd)
+        assert (root / ".cache" / "test_impact.json").exists()
+
+    @pytest.mark.parametrize("changed", [
+        ["tests/conftest.py", "app.py"],
+        ["data.json", "app.py"],
+    ])
+    def test_verify_test_impact_runs_all_for_unimported_changes(self, temp_dir, changed):
+        """Test conftest and non-Python changes select the full suite"""
+        root = Path(temp_dir)
+        (root / "app.py").write_bytes(b"VALUE = 1\n")
+        (root / "tests").mkdir()
+        (root / "tests" / "test_app.py").write_bytes(b"import app\n")
+
+        index = TestImpactIndex(temp_dir, str(root / ".cache"))
+
+        assert index.impacted_tests(["app.py"]) == [str(Path("tests") / "test_app.py")]
+        assert index.impacted_tests(changed) is None
+
+    def test_verify_test_impact_runs_all_when_conftest_imports_change(self, temp_dir):
+        """Test a change reaching a conftest.py selects the full suite"""
+        root = Path(temp_dir)
+        (root / "app.py").write_bytes(b"VALUE = 1\n")
+        (root / "helpers.py").write_bytes(b"VALUE = 2\n")
+        (root / "tests").mkdir()
+        (root / "tests" / "conftest.py").write_bytes(b"import helpers\n")
+        (root / "tests" / "test_app.py").write_bytes(b"import app\n")
+        (root / "tests" / "test_fixture_user.py").write_bytes(b"def test_it(helper): pass\n")
+
+        index = TestImpactIndex(temp_dir, str(root / ".cache"))
+
+        assert index.impacted_tests(["app.py"]) == [str(Path("tests") / "test_app.py")]
+        assert index.impacted_tests(["app.py", "helpers.py"]) is None
+
+    def test_verify_test_timeout_kills_run(self, temp_dir):
+        """Test a run over budget is killed and reported as timed out"""
+        checker = TestChecker()
+        checker.TIMEOUT = 0.2
+
+        result = checker.check({
+            "work_dir": temp_dir,
+            "test_command": f"{sys.executable} -c __import__('time').sleep(10)",
+        })
+
+        assert not result.passed
+        assert result.message == "Tests timed out"
+
+    def test_verify_test_parse_summary(self):
+        """Test parsing a pytest summary line"""
+        checker = TestChecker()
+        stats = checker._parse_test_output("===== 2 failed, 7 passed, 1 skipped in 0.4s =====")
+
+        assert stats == {"total": 10, "passed": 7, "failed": 2, "skipped": 1}
 
 
 class TestGoalMatcher:
@@ -134,10 +319,7 @@ class TestGoalMatcher:
 
     def test_verify_goal_match_success(self, mock_agent):
         """Test goal matching success"""
-        mock_agent.execute.return_value = AgentResponse(
-            success=True,
-            output='{"matches": true, "score": 0.95, "matched_criteria": ["All"], "unmatched_criteria": [], "assessment": "Good match"}',
-        )
+        mock_agent.execute.return_value = _AR_FULL_MATCH
 
         checker = GoalMatcher(agent=mock_agent)
         result = checker.check({
@@ -151,10 +333,7 @@ class TestGoalMatcher:
 
     def test_verify_goal_match_partial(self, mock_agent):
         """Test partial goal match"""
-        mock_agent.execute.return_value = AgentResponse(
-            success=True,
-            output='{"matches": false, "score": 0.5, "matched_criteria": ["GET"], "unmatched_criteria": ["POST"], "assessment": "Partial"}',
-        )
+        mock_agent.execute.return_value = _AR_PARTIAL
 
         checker = GoalMatcher(agent=mock_agent)
         result = checker.check({
@@ -166,6 +345,23 @@ class TestGoalMatcher:
         assert not result.passed
         assert result.score < 0.8
 
+    def test_verify_goal_match_fenced_json(self, mock_agent):
+        """Test agent answer wrapped in a markdown code block"""
+        mock_agent.execute.return_value = AgentResponse(
+            success=True,
+            output='Assessment:\n```json\n{"matches": true, "score": 0.9, "assessment": "Fine"}\n```',
+        )
+
+        checker = GoalMatcher(agent=mock_agent)
+        result = checker.check({
+            "goal": "Create CRUD API",
+            "implementation": "All endpoints",
+            "criteria": [],
+        })
+
+        assert result.passed
+        assert result.message == "Fine"
+
     def test_verify_goal_match_simple(self):
         """Test simple keyword-based goal matching without agent"""
         checker = GoalMatcher(agent=None)
@@ -175,8 +371,34 @@ class TestGoalMatcher:
             "criteria": [],
         })
 
-        # Should use simple matching
-        assert isinstance(result, CheckResult)
+        # Only "user" of create, user, management appears
+        assert not result.passed
+        assert result.message == "Keyword match: 1/3 keywords"
+
+    def test_verify_goal_match_simple_keywords(self):
+        """Test keyword overlap is counted case-insensitively"""
+        checker = GoalMatcher(agent=None)
+        result = checker.check({
+            "goal": "Create user management API",
+            "implementation": "# CREATE, list and delete USER records (Management)",
+            "criteria": [],
+        })
+
+        assert result.message == "Keyword match: 3/3 keywords"
+        assert result.score == 1.0
+
+    def test_verify_goal_match_simple_criteria(self):
+        """Test criteria quoted in the implementation are reported but not scored"""
+        checker = GoalMatcher(agent=None)
+        result = checker.check({
+            "goal": "Provide greeting helpers",
+            "implementation": "def say_hello(): ...\ndef say_goodbye(): ...",
+            "criteria": ["say_hello", "SAY_GOODBYE"],
+        })
+
+        assert not result.passed
+        assert result.score == 0.0
+        assert result.details["matched"] == ["say_hello", "SAY_GOODBYE"]
 
 
 class TestQualityChecker:
@@ -186,7 +408,7 @@ class TestQualityChecker:
         """Test quality check for good code"""
         # Create a well-formatted file
         code_file = Path(temp_dir) / "good.py"
-        code_file.write_text('''"""Good module."""
+        code_file.write_bytes(b'''"""Good module."""
 
 
 def hello():
@@ -207,11 +429,7 @@ def hello():
         """Test quality check finding issues"""
         # Create a file with quality issues
         code_file = Path(temp_dir) / "bad.py"
-        code_file.write_text(
-            'x = 1\n' * 600 +  # Very long file
-            'print("debug")\n' +  # Debug output
-            '# TODO: fix this\n'  # TODO comment
-        )
+        code_file.write_bytes(_BAD_PY)
 
         checker = QualityChecker()
         result = checker.check({
@@ -221,6 +439,59 @@ def hello():
 
         assert len(result.details.get("issues", [])) > 0
 
+    @pytest.mark.parametrize("lines, flagged", [(500, False), (501, True)])
+    def test_verify_quality_line_count_boundary(self, temp_dir, lines, flagged):
+        """Test the trailing newline does not count as an extra line"""
+        (Path(temp_dir) / "long.py").write_bytes(b"x = 1\n" * lines)
+
+        result = QualityChecker().check({"files": ["long.py"], "work_dir": temp_dir})
+
+        too_long = [i for i in result.details["issues"] if "File too long" in i]
+        assert too_long == ([f"long.py: File too long ({lines} lines)"] if flagged else [])
+
+    def test_verify_quality_reports_first_long_line(self, temp_dir):
+        """Test only the first over-long line is reported"""
+        code_file = Path(temp_dir) / "wide.py"
+        code_file.write_bytes(b"x = 1\n" + b"y = '" + b"a" * 130 + b"'\n" + b"z = '" + b"b" * 200 + b"'\n")
+
+        checker = QualityChecker()
+        result = checker.check({
+            "files": ["wide.py"],
+            "work_dir": temp_dir,
+        })
+
+        assert result.details["issues"] == ["wide.py:2: Line too long (136 chars)"]
+
+    def test_verify_quality_large_file_scans_head(self, temp_dir):
+        """Test oversized files are flagged by size without a full scan"""
+        code_file = Path(temp_dir) / "generated.py"
+        code_file.write_bytes(b"x = 1\n" * 50_000 + b"# TODO: unreachable\n")
+
+        checker = QualityChecker()
+        result = checker.check({
+            "files": ["generated.py"],
+            "work_dir": temp_dir,
+        })
+
+        size = code_file.stat().st_size
+        assert result.details["issues"] == [f"generated.py: File too large ({size} bytes)"]
+
+    def test_verify_quality_markers(self, temp_dir):
+        """Test debug and TODO markers are each reported once"""
+        code_file = Path(temp_dir) / "app.js"
+        code_file.write_bytes(b"// FIXME later\nconsole.log(1)\n// TODO\nconsole.log(2)\n")
+
+        checker = QualityChecker()
+        result = checker.check({
+            "files": ["app.js"],
+            "work_dir": temp_dir,
+        })
+
+        assert result.details["issues"] == [
+            "app.js: Contains debug output",
+            "app.js: Contains TODO/FIXME comments",
+        ]
+
     def test_verify_diff_analysis(self, temp_dir):
         """Test analyzing diffs (via quality checker)"""
         # Quality checker includes basic diff-like checks
@@ -232,22 +503,15 @@ def hello():
             "work_dir": temp_dir,
         })
 
-        assert "not found" in str(result.details.get("issues", []))
+        assert result.details["issues"] == ["File not found: nonexistent.py"]
 
 
 class TestVerificationChecker:
     """Tests for combined verification checker"""
 
-    def test_verification_checker_all_pass(self, temp_dir, mock_agent):
+    def test_verification_checker_all_pass(self, valid_py, mock_agent):
         """Test when all checks pass"""
-        # Create valid file
-        code_file = Path(temp_dir) / "valid.py"
-        code_file.write_text("def hello(): return 'world'\n")
-
-        mock_agent.execute.return_value = AgentResponse(
-            success=True,
-            output='{"matches": true, "score": 1.0, "matched_criteria": [], "unmatched_criteria": [], "assessment": "Perfect"}',
-        )
+        mock_agent.execute.return_value = _AR_PERFECT
 
         checker = VerificationChecker(agent=mock_agent)
 
@@ -255,41 +519,90 @@ class TestVerificationChecker:
             mock_test.return_value = CheckResult(name="tests", passed=True, score=1.0)
 
             report = checker.verify({
-                "files": ["valid.py"],
-                "work_dir": temp_dir,
+                "files": [valid_py.name],
+                "work_dir": str(valid_py.parent),
                 "goal": "Create hello function",
                 "implementation": "def hello(): return 'world'",
             })
 
-        assert isinstance(report, VerificationReport)
+        assert report.passed
+        assert [c.name for c in report.checks] == ["syntax", "tests", "goal_match", "quality"]
+        assert report.overall_score == 1.0
 
     def test_verification_checker_partial(self, temp_dir, mock_agent):
         """Test when some checks fail"""
         checker = VerificationChecker(agent=mock_agent)
 
-        # Only syntax checker will work properly
-        report = checker.verify({
-            "files": [],
-            "work_dir": temp_dir,
-            "goal": "",
-            "implementation": "",
-        })
+        # No tests are collected and there is no goal to match
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value = _finished_process(5, "no tests ran in 0.01s\n")
 
-        assert isinstance(report, VerificationReport)
+            report = checker.verify({
+                "files": [],
+                "work_dir": temp_dir,
+                "goal": "",
+                "implementation": "",
+            })
+
+        results = {c.name: c.passed for c in report.checks}
+        assert results == {"syntax": True, "tests": False, "goal_match": False, "quality": True}
+        assert not report.passed
+
+    def test_verification_checker_keeps_checker_order(self):
+        """Test concurrent checks report in checker order and contain errors"""
+        first = Mock()
+        first.name = "first"
+        first.check.return_value = CheckResult(name="first", passed=True, score=1.0)
+        broken = Mock()
+        broken.name = "broken"
+        broken.check.side_effect = RuntimeError("boom")
+        last = Mock()
+        last.name = "last"
+        last.check.return_value = CheckResult(name="last", passed=True, score=1.0)
+
+        report = VerificationChecker(checkers=[first, broken, last]).verify({})
+
+        assert [c.name for c in report.checks] == ["first", "broken", "last"]
+        assert report.checks[1].message == "Check failed: boom"
+        assert not report.passed
+
+    def test_verification_checker_blocking_failure_skips_rest(self, temp_dir):
+        """Test a failed syntax check skips the checks that depend on it"""
+        (Path(temp_dir) / "broken.py").write_bytes(b"def broken(\n")
+        tests = Mock(blocking=False)
+        tests.name = "tests"
+
+        checker = VerificationChecker(checkers=[SyntaxChecker(), tests])
+        report = checker.verify({"files": ["broken.py"], "work_dir": temp_dir})
+
+        assert not tests.check.called
+        assert [c.name for c in report.checks] == ["syntax", "tests"]
+        assert report.checks[1].message == "Skipped: prior blocking check failed"
+        assert not report.passed
 
     def test_verification_report_summary(self):
         """Test verification report generation"""
-        report = VerificationReport(
-            passed=False,
-            overall_score=0.65,
-            checks=[
-                CheckResult(name="syntax", passed=True, score=1.0),
-                CheckResult(name="tests", passed=False, score=0.5),
-                CheckResult(name="quality", passed=True, score=0.8),
-            ],
-            summary="2/3 checks passed",
-        )
+        report = _TEMPLATE_REPORT
 
         assert report.passed_count == 2
         assert report.total_count == 3
         assert "syntax: PASS" in report.summary or report.passed_count == 2
+
+    def test_verification_report_to_dict(self):
+        """Test report serialization includes each check"""
+        report = VerificationReport(
+            passed=True,
+            overall_score=1.0,
+            checks=[replace(_CR_SYNTAX, message="ok")],
+        )
+
+        data = report.to_dict()
+
+        assert data["passed_count"] == 1
+        assert data["checks"] == [{
+            "name": "syntax",
+            "passed": True,
+            "score": 1.0,
+            "message": "ok",
+            "details": {},
+        }]